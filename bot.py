@@ -3,12 +3,26 @@ from discord.ext import commands
 from PIL import Image, ImageDraw
 from io import BytesIO
 import random
+import functools
+import math
 import time
 import json, os
+import re
+import signal
 import tempfile
+from contextlib import suppress
+from collections import defaultdict, namedtuple
+from datetime import timedelta
 import logging   # ← add this
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Sequence
 import asyncio  # if not already imported
+try:
+    import orjson  # optional: much faster state encoding, emits UTF-8 bytes directly
+except ImportError:
+    orjson = None
 _persist_lock = asyncio.Lock()
 
 # Always write to the mounted Railway volume
@@ -26,6 +40,11 @@ logging.basicConfig(
     level=logging.INFO,  # INFO so you see normal activity
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
 )
+# Hand records to a listener thread so stream writes never block the event loop
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *logging.root.handlers, respect_handler_level=True)
+logging.root.handlers = [QueueHandler(_log_queue)]
+_log_listener.start()
 
 log = logging.getLogger("bingo")          # your app logs
 discord_log = logging.getLogger("discord")  # discord.py logs
@@ -105,26 +124,24 @@ TEAM_CHALLENGE_INFO = {
 
 
 # --- Allowlist for admin commands (use real Discord user IDs) ---
-ALLOWED_ADMINS = {
-      991856535930163230,  # disco
+ALLOWED_ADMINS = frozenset({
+    991856535930163230,  # disco
     221415080514945035,  # limon
     122899028617854976,  # lyreth
     1266487519822872738,  # uimalchemy
     269658379981553674,  # lexi
     213805215890014209,  # kiuyu
     468530835570556938,  # varrock
-
-
-
-}
+})
 
 def is_allowed_admin():
+    # One hashed lookup on the author's user ID; no role iteration involved
     async def predicate(ctx):
         return ctx.author.id in ALLOWED_ADMINS
     return commands.check(predicate)
 
 # Commands whose *triggers* should be deleted automatically
-ADMIN_COMMAND_NAMES = {
+ADMIN_COMMAND_NAMES = frozenset({
     # core admin
     "tileall", "addpoints", "removepoints", "addbonuspoints", "removebonuspoints",
     "setboard", "setnextboard", "reset", "resetall", "pointsallteams",
@@ -132,7 +149,7 @@ ADMIN_COMMAND_NAMES = {
     "hola", "finishevent",
     # private cleanup tools (still hidden from !bingocommands)
     "cleanup", "delete", "purge",
-}
+})
 
 # Board order per team
 team_sequences = {
@@ -142,26 +159,31 @@ team_sequences = {
     "team4": ["E", "B", "F", "C", "D", "A"],
 }
 
-# Per-team game state
-game_state = {
-    team: {
+# The team roster is fixed by team_sequences (game_state always has exactly these
+# keys), so admin team arguments validate against this set, not the live state
+TEAM_KEYS = frozenset(team_sequences)
+
+def _fresh_team_state() -> dict:
+    """A brand-new team record (also what !reset / !resetall put back)."""
+    return {
         "board_index": 0,
-        "completed_tiles": [],
+        "completed_tiles": set(),  # set in memory; saved as a sorted list
         "bonus_active": False,
         "points": 0,
         "bonus_points": 0,
         "started": False,
         "used_quips": {},          # track per-team quip usage
         "looped": False,
-        "finished": False,   # 👈 new field
-
+        "finished": False,
     }
-    for team in team_sequences
-}
+
+
+# Per-team game state
+game_state = {team: _fresh_team_state() for team in team_sequences}
 
 def _normalize_team_state(st: dict) -> dict:
     st.setdefault("started", False)
-    st.setdefault("completed_tiles", [])
+    st.setdefault("completed_tiles", set())
     st.setdefault("bonus_active", False)
     st.setdefault("board_index", 0)
     st.setdefault("looped", False)
@@ -169,20 +191,27 @@ def _normalize_team_state(st: dict) -> dict:
     st.setdefault("points", 0)
     st.setdefault("bonus_points", 0)
 
-    if isinstance(st["completed_tiles"], set):
-        st["completed_tiles"] = list(st["completed_tiles"])
     try:
-        st["completed_tiles"] = sorted({int(t) for t in st["completed_tiles"] if 1 <= int(t) <= 9})
+        st["completed_tiles"] = {int(t) for t in st["completed_tiles"] if 1 <= int(t) <= 9}
     except Exception:
-        st["completed_tiles"] = []
+        st["completed_tiles"] = set()
     return st
 
-PENDING_PURGE_CONFIRMATIONS = {}  # {channel_id: {"user": int, "expires": float}}
+PurgeReq = namedtuple("PurgeReq", "user handle")  # arming user id, expiry TimerHandle
+PENDING_PURGE_CONFIRMATIONS = {}  # {channel_id: PurgeReq}
+PURGE_CONFIRM_SECONDS = 20
+# !purge N scans at most max(MIN, N * FACTOR) recent messages for bot ones
+PURGE_SCAN_MIN = 200
+PURGE_SCAN_FACTOR = 8
 
 # Quip memory for non-team cases (must be defined BEFORE persistence helpers)
 
 GLOBAL_USED_QUIPS = {}
 
+def _on_sigterm():
+    # Keep a reference so the close task can't be garbage-collected mid-run
+    bot._close_task = asyncio.create_task(bot.close())
+
 @bot.event
 async def on_ready():
     # run once
@@ -203,23 +232,38 @@ async def on_ready():
     try:
         await save_state(game_state)
     except Exception as e:
-        print("[BOOT] save_state failed:", e)
+        log.error("[BOOT] save_state failed: %s", e)
 
     bot._initialized = True
+    bot._state_flusher = asyncio.create_task(_state_flusher())
+    bot._trigger_delete_flusher = asyncio.create_task(_trigger_delete_flusher())
+    # Railway stops/redeploys with SIGTERM, whose default handler skips the
+    # shutdown flush below bot.run; close cleanly so that flush still runs
+    with suppress(NotImplementedError):  # no signal handlers on Windows loops
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, _on_sigterm
+        )
+    await load_challenge_images()
+
+    # Seed the channel -> team map for the team channels we can see
+    for guild in bot.guilds:
+        for channel in guild.text_channels:
+            if channel_team_key(channel) not in game_state:
+                CHANNEL_TEAM.pop(channel.id, None)
 
     # Boot diagnostics
-    print(f"Logged in as {bot.user}")
-    print("[BOOT] ASSETS_DIR:", ASSETS_DIR)
+    log.info("Logged in as %s", bot.user)
+    log.info("[BOOT] ASSETS_DIR: %s", ASSETS_DIR)
     try:
-        print("[BOOT] PNGs found:", [p.name for p in ASSETS_DIR.glob("*.png")])
+        log.info("[BOOT] PNGs found: %s", [p.name for p in ASSETS_DIR.glob("*.png")])
     except Exception as e:
-        print("[BOOT] Error listing PNGs:", e)
+        log.error("[BOOT] Error listing PNGs: %s", e)
 
     # Duplicate command check
     names = [cmd.name for cmd in bot.commands]
     dupes = {n for n in names if names.count(n) > 1}
-    print("Loaded commands:", len(names))
-    print("Duplicate commands found:", dupes)
+    log.info("Loaded commands: %d", len(names))
+    log.info("Duplicate commands found: %s", dupes)
 
 
 
@@ -247,34 +291,78 @@ def _serialize_state():
     }
 
 
-async def save_state(game_state: dict):
-    data = _serialize_state()
-    async with _persist_lock:
-        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(STATE_PATH), prefix=".tmp_state_", text=True)
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-                f.flush()
-                os.fsync(f.fileno())  # ✅ force commit to disk
+STATE_WRITE_BUFFER = 64 * 1024
+_last_written_payload = None  # bytes of the last successful write
 
-            if os.path.exists(STATE_PATH):
-                try:
-                    if os.path.exists(STATE_BAK):
-                        os.remove(STATE_BAK)
-                    os.replace(STATE_PATH, STATE_BAK)
-                except Exception:
-                    pass
-            os.replace(tmp, STATE_PATH)
 
-            # ✅ new log line
-            print(f"[SAVE] State written to {STATE_PATH} ({len(json.dumps(data))} bytes)")
+def _write_state_file(data: dict):
+    global _last_written_payload
+    # Compact output: ~30% fewer bytes than indent=2, and one buffered write
+    if orjson is not None:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    # Nothing changed since the last write (e.g. the shutdown flush right after a
+    # debounced save): skip the temp file, fsync, backup rotation and rename
+    if payload == _last_written_payload:
+        return
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(STATE_PATH), prefix=".tmp_state_")
+    try:
+        with os.fdopen(fd, "wb", buffering=STATE_WRITE_BUFFER) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())  # ✅ force commit to disk
+        size = len(payload)
 
-        finally:
+        if os.path.exists(STATE_PATH):
             try:
-                if os.path.exists(tmp):
-                    os.remove(tmp)
+                if os.path.exists(STATE_BAK):
+                    os.remove(STATE_BAK)
+                os.replace(STATE_PATH, STATE_BAK)
             except Exception:
                 pass
+        os.replace(tmp, STATE_PATH)
+        _last_written_payload = payload
+
+        # ✅ new log line (size is len(payload), the bytes just written — no stat or re-encode)
+        log.info("[SAVE] State written to %s (%d bytes)", STATE_PATH, size)
+
+    finally:
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except Exception:
+            pass
+
+
+async def save_state(game_state: dict):
+    # Snapshot on the event loop thread. Commands mutate game_state without an
+    # await between read and write (and only *mark* it dirty), so a snapshot
+    # taken here can never see a half-applied update — no state lock needed.
+    data = _serialize_state()
+    async with _persist_lock:
+        # Encode + fsync on a worker thread; the snapshot shares nothing mutable with game_state
+        await asyncio.to_thread(_write_state_file, data)
+
+
+# --- Debounced writes: commands mark the state dirty, one task flushes ---
+SAVE_DEBOUNCE_SECONDS = 0.25
+_state_dirty = asyncio.Event()
+
+def mark_state_dirty():
+    """Schedule a save; bursts of mutations inside the debounce window share one write."""
+    _state_dirty.set()
+
+
+async def _state_flusher():
+    while True:
+        await _state_dirty.wait()
+        await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+        _state_dirty.clear()
+        try:
+            await save_state(game_state)
+        except Exception:
+            log.exception("[SAVE] Debounced save failed")
 
 
 
@@ -294,8 +382,9 @@ def load_state():
                 continue
 
     if not data:
-        print("[INFO] No prior state file; starting fresh.")
-        return {}
+        log.info("No prior state file; starting fresh.")
+        # Keep the fresh per-team defaults; returning {} would wipe every team
+        return game_state
 
     loaded_gs = data.get("game_state", {})
     loaded_global_quips = data.get("GLOBAL_USED_QUIPS", {})
@@ -307,7 +396,7 @@ def load_state():
             uq = {cat: set(vals) for cat, vals in s.get("used_quips", {}).items()}  # lists -> sets
             game_state[team_key].update({
                 "board_index": s.get("board_index", 0),
-                "completed_tiles": s.get("completed_tiles", []),
+                "completed_tiles": set(s.get("completed_tiles", [])),  # list -> set
                 "bonus_active": s.get("bonus_active", False),
                 "points": s.get("points", 0),
                 "bonus_points": s.get("bonus_points", 0),
@@ -325,7 +414,11 @@ def load_state():
         GLOBAL_USED_QUIPS[cat] = set(vals)
 
     # ✅ new log line
-    print(f"[LOAD] State loaded: {len(loaded_gs)} teams, {sum(len(v.get('completed_tiles', [])) for v in loaded_gs.values())} tiles marked complete")
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "[LOAD] State loaded: %d teams, %d tiles marked complete",
+            len(loaded_gs), sum(len(v.get("completed_tiles", [])) for v in loaded_gs.values()),
+        )
 
     return game_state
 
@@ -333,7 +426,7 @@ def load_state():
 
 
 
-LAST_RESETALL_CALL = 0  # prevents accidental double-fires
+LAST_RESETALL_CALL = float("-inf")  # time.monotonic(); prevents accidental double-fires
 
 # Real bonus challenges
 bonus_challenges = {
@@ -350,16 +443,59 @@ bonus_challenges = {
     "F": "Acquire and complete 1 champion scroll. \n\n Submit a screenshot of the champion scroll drop, and kill completion. \n\n+5 bonus points."
 }
 
+# Quoted challenge text + full bonus reveal message, built once per board
+BONUS_CHALLENGE_BLOCKS = {
+    letter: "> " + "\n> ".join(raw.replace("/n", "\n").splitlines())
+    for letter, raw in bonus_challenges.items()
+}
+BONUS_MESSAGES = {
+    letter: (
+        "🔮 **A wild Bonus Tile has appeared!**\n\n"
+        f"{block}\n\n"
+        "- Type `!finishbonus` when you have completed the Bonus Tile challenge.\n"
+        "- Or, type `!skipbonus` to skip the Bonus Tile and move to the next board."
+    )
+    for letter, block in BONUS_CHALLENGE_BLOCKS.items()
+}
+
 # =========================
 # Bingo Betty Quip System
 # =========================
 
+# Dedicated RNG for quip picks (single seed point if a run ever needs replaying)
+_rng = random.Random()
+_rand_choice = _rng.choice  # bound once; quip picks are the hot path
 
-def get_quip(team_key: str, category: str, pool: list[str]) -> str:
+
+def _pick_unused(pool: Sequence[str], used: set) -> str:
+    """Pick a random quip not in `used` and mark it; clears `used` once the pool is exhausted.
+
+    Not O(1): cheap while most of the pool is unused, but near exhaustion a call
+    can make up to len(pool) draws plus one O(n) scan. Fine for pools this size.
+    """
+    # Random draws usually hit an unused quip early; fall back to a scan if they keep missing
+    for _ in range(len(pool)):
+        choice = _rand_choice(pool)
+        if choice not in used:
+            break
+    else:
+        available = [q for q in pool if q not in used]
+        if not available:
+            # reset when exhausted
+            used.clear()
+            available = pool
+        choice = _rand_choice(available)
+
+    used.add(choice)
+    return choice
+
+
+def get_quip(team_key: str, category: str, pool: Sequence[str]) -> str:
     """
     Returns a non-repeating quip for the given team & category.
     For non-team cases (e.g., 'global'), we keep a separate store so we don't KeyError.
     When a pool is exhausted, it resets so all quips become available again.
+    The raw quip is tracked; the returned text is its precomputed Bingo Betty wrap.
     """
     # choose the right used-quips dictionary
     if team_key == "global" or team_key not in game_state:
@@ -368,16 +504,10 @@ def get_quip(team_key: str, category: str, pool: list[str]) -> str:
         used_dict = game_state[team_key]["used_quips"]
 
     used = used_dict.setdefault(category, set())
-    available = [q for q in pool if q not in used]
-
-    if not available:
-        # reset when exhausted
-        used_dict[category] = set()
-        available = pool[:]
-
-    choice = random.choice(available)
-    used_dict[category].add(choice)
-    return f'🗣️ Bingo Betty says: *"{choice}"*'
+    raw = _pick_unused(pool, used)
+    wrapped = _BETTY_WRAPPED.get(raw)
+    # Pools formatted per call (e.g. start_board's {letter}) aren't precomputed
+    return wrapped if wrapped is not None else _betty_says(raw)
 
 
 
@@ -386,8 +516,13 @@ def get_quip(team_key: str, category: str, pool: list[str]) -> str:
 # Quip Pools
 # -------------------------
 
+# Pools hold raw quips: used-quip history is persisted, so it must track the
+# raw text. The wrapped text is built once below (_BETTY_WRAPPED) for get_quip.
+# Admin pools further down are templates ({amount}/{team}) used directly.
+_betty_says = '🗣️ Bingo Betty says: *"{}"*'.format
+
 # ✅ Tile Completion
-QUIPS_TILE_COMPLETE = [
+QUIPS_TILE_COMPLETE = (
     "One-one thousand, two-one thousand, three—OH S#%& YOU ACTUALLY FINISHED A TILE. I wasn’t emotionally prepared. Take your point and stop looking smug. 🙃",
     "You again? Worse than my clingy ex. But fine — tile complete, point awarded, and Bingo Betty will be insufferable about it later. Go. 😂",
     "HOW DARE you be competent when I had a roast locked and loaded. I’m furious. Also… a little proud. Ew. Don’t tell anyone. 🫃",
@@ -459,10 +594,10 @@ QUIPS_TILE_COMPLETE = [
     "I was 10 seconds from narrating your collapse. You robbed me of performance art. 🎭",
     "You finished a tile and emotionally damaged me in the process. Five stars. ⭐️",
 
-]
+)
 
 # ❌ Tile Removal (12)
-QUIPS_TILE_REMOVE = [
+QUIPS_TILE_REMOVE = (
     "Reversing progress? Bold. Like rewinding a movie just to cry at the sad part again. Point removed. Dignity pending. 🙃",
     "Tile undone. The bards are switching from epic ballad to comedy roast. I volunteer to lead vocals. 😂",
     "We’re backpedaling now? Cute. Next you’ll trip over your own expectations. Point deducted.",
@@ -475,10 +610,10 @@ QUIPS_TILE_REMOVE = [
     "You discovered reverse gear. Powerful. Misguided. Expensive. Point deleted.",
     "Consider this a learning montage, except no music and I’m judging you. –1.",
     "You pressed CTRL+Z on success. Innovative. Ill-advised. Minus one.",
-]
+)
 
 # 🎬 Start Board (10)
-QUIPS_START_BOARD = [
+QUIPS_START_BOARD = (
     "New board, same chaos. Ugh, it’s you again. Like glitter in a carpet — permanent and annoying. Board {letter} unlocked. Don’t waste my oxygen. 🙃",
     "Curtains up, gremlins out. Board {letter} is live. Try not to trip over Act One this time.",
     "Welcome to Board {letter}. I’ve preheated the oven for drama. Please rise responsibly.",
@@ -489,10 +624,10 @@ QUIPS_START_BOARD = [
     "The stage is set: Board {letter}. Deliver competence with a side of chaos. I’m hungry.",
     "Board {letter} open. May your luck be loud and your excuses silent. 🙃",
     "Okay, Team {team}. Board {letter}. Win accidentally or on purpose — I’m not picky.",
-]
+)
 
 # 🏆 Bonus Completion (10) – includes the two you liked
-QUIPS_BONUS_COMPLETE = [
+QUIPS_BONUS_COMPLETE = (
     "Wait—WAIT—did you just… oh my stars, you did. You finished the Bonus Tile. And without even breaking a sweat? I’m offended. And impressed. Equally.",
     "Okay, pause. I was literally mid-eye roll when you smashed the Bonus Tile into the stratosphere. Now I’ve gotta pick my jaw up off the floor.",
     "The Bonus Tile… complete?! I had a roast ready, a spotlight queued, and a dramatic sigh rehearsed. You ruined everything. I’m thrilled. 🙃",
@@ -503,10 +638,10 @@ QUIPS_BONUS_COMPLETE = [
     "Bonus obliterated. Somewhere a narrator weeps and a scoreboard sings. Disgusting. Encore.",
     "You broke the bonus like it was a cheap prop. I love practical effects. Brava.",
     "That was cinematic. I’ll allow it. Frame the moment before I change my mind.",
-]
+)
 
 # 🏳️ Bonus Skip (12)
-QUIPS_BONUS_SKIP = [
+QUIPS_BONUS_SKIP = (
     "Skipped the Bonus Tile? A Shakespearean tragedy. I imagined Act III; you tripped over the curtain in Act I. Iconic cowardice. 🙃",
     "Skipping is a strategy. Not a winning one, but a strategy. Wear it with flair and keep walking.",
     "You looked destiny in the eye and said ‘hard pass.’ I laughed, then marked it down. Next board.",
@@ -519,59 +654,91 @@ QUIPS_BONUS_SKIP = [
     "Tragic heroine energy: dramatic cape, no follow-through. I’m entertained. Proceed.",
     "You skipped the dessert course and asked for the bill. Fine. Next course.",
     "The chorus booed; I clapped ironically. Skip accepted. Go.",
-]
+)
 
 # 📊 Progress (6)
-QUIPS_PROGRESS = [
+QUIPS_PROGRESS = (
     "Progress check? Insecure much. Fine: here’s your status. Use it wisely or ignore it spectacularly — I’ll roast either way. 🙃",
     "You want numbers? Here’s numbers. I’ll even pretend to be proud while you read them.",
     "We’re measuring progress like it’s personality. It’s not. But I’ll indulge you.",
     "Fine. Here’s the state of your chaos. Try not to cry on it.",
     "Status delivered. Expectations withheld. Keep crawling; I’m timing it.",
     "I’ve seen snails overtake you, but this will do. Barely.",
-]
+)
 
 # 🧮 Points (6)
-QUIPS_POINTS = [
+QUIPS_POINTS = (
     "Math time. I did it so you don’t have to — which frankly feels like charity. 🙃",
     "Behold: arithmetic with judgment. Savor it.",
     "Numbers updated. Hope you like the taste of accountability.",
     "I added. I subtracted. I survived. You’re welcome.",
     "Here’s your score. Manage your ego accordingly.",
     "Cold numbers, warm shade. My specialty.",
-]
+)
+
+# 🧹 Global reset
+QUIPS_RESETALL = (
+    "Global reset executed. Fresh chaos unlocked. Don’t make me regret this.",
+    "All teams scrubbed clean. Like it never happened. Except I remember everything.",
+    "Factory settings restored. Perform better in the sequel, please.",
+    "We nuked it from orbit. Only way to be sure. Proceed.",
+    "Clean slate delivered. Try not to smudge it immediately.",
+)
+
+# 📜 Command lists
+QUIPS_HELP_COMMANDS = (
+    "Fine, mortals. Here are your precious commands. Try not to pull a muscle scrolling. 🙃",
+    "Command scroll unfurled! Don’t smudge it with your grubby fingers.",
+    "A list of commands? Riveting. Use them wisely—or spectacularly badly. I’ll mock you either way.",
+)
+QUIPS_HELP_ALLCOMMANDS = (
+    "Ah, the secret scroll. Handle it with care—or don’t, and I’ll laugh. 🙃",
+    "So you want the whole playbook? Fine. Try not to drown in power.",
+    "Admin knowledge unlocked. Abuse it spectacularly, please.",
+)
+
+# raw quip -> "🗣️ Bingo Betty says: …" text, built once for the static get_quip pools
+_BETTY_WRAPPED = {
+    q: _betty_says(q)
+    for pool in (
+        QUIPS_TILE_COMPLETE, QUIPS_TILE_REMOVE, QUIPS_BONUS_COMPLETE, QUIPS_BONUS_SKIP,
+        QUIPS_PROGRESS, QUIPS_POINTS, QUIPS_RESETALL, QUIPS_HELP_COMMANDS, QUIPS_HELP_ALLCOMMANDS,
+    )
+    for q in pool
+}
 
 # 👑 Admin Add / Remove Bonus Points
-QUIPS_ADMIN_ADD = [
+# (templates: callers .format(amount=..., team=...) and add the Betty wrapper)
+QUIPS_ADMIN_ADD = (
     "Admin sprinkled +{amount} bonus points on {team} like glitter on a disaster. Festive. Unearned? We’ll see. 🙃",
     "+{amount} bonus points appeared out of nowhere. If this is favoritism, be more subtle next time.",
     "The Points Fairy visited {team}. I don’t do tooth fairy rates, but enjoy the deposit of +{amount} bonus points.",
     "Administrative generosity detected: +{amount} to {team}. Spend it loudly.",
     "A mysterious benefactor gifted {team} a suspicious +{amount} bonus points. I’m starting rumors immediately.",
-]
-QUIPS_ADMIN_REMOVE = [
+)
+QUIPS_ADMIN_REMOVE = (
     "Admin clawed back {amount} bonus points from {team}. Consider it a vibe tax. 😂",
     "Subtraction event: {amount} bonus points removed from {team}. Actions, consequences, etc.",
     "Down we go: –{amount} bonus points for {team}. I brought popcorn.",
     "Audit complete. {team} lost {amount} bonus points. Cry quietly; I’m working.",
     "Administrative smite: –{amount} bonus points to {team}. Stand up straighter.",
-]
+)
 
 # 👑 Admin Add / Remove TILE Points (for !addpoints / !removepoints)
-QUIPS_ADMIN_ADD_TILE = [
+QUIPS_ADMIN_ADD_TILE = (
     "Admin granted +{amount} points to {team}. Don’t spend them all on mediocrity. 🙃",
     "+{amount} points landed in {team}'s lap. Skill? Luck? I’ll allow it.",
     "The scoreboard sneezed and gave {team} a nasty +{amount} points. Sanitize appropriately.",
     "Administrative generosity: +{amount} points to {team}. Temporary glory, permanent shade.",
     "Points fell from the sky: +{amount} for {team}. Don’t get used to it.",
-]
-QUIPS_ADMIN_REMOVE_TILE = [
+)
+QUIPS_ADMIN_REMOVE_TILE = (
     "Audit time. –{amount} points stripped from {team}. Cry harder.",
     "{team} just lost {amount} points. I’d call it justice.",
     "Subtraction ritual: –{amount} points from {team}. Balance restored.",
     "Admin swung the axe: {team} loses {amount} points. Brutal. Necessary.",
     "–{amount} points for {team}. The scoreboard sighed in relief.",
-]
+)
 
 # (Optional) Rename your existing pools to make intent obvious:
 # QUIPS_ADMIN_ADD  -> QUIPS_ADMIN_ADD_BONUS
@@ -583,7 +750,7 @@ QUIPS_ADMIN_REMOVE_BONUS = QUIPS_ADMIN_REMOVE
 
 
 # 🔮 Bonus reveal quips (Bingo Betty) — shown right after a team completes all 9 tiles
-QUIPS_BONUS_REVEAL = [
+QUIPS_BONUS_REVEAL = (
     "🎉 Against all odds (and my betting pool), {team} finished **all 9 tiles** on Board {letter}. Ugh, fine, applause. 🙃\n\n✨ Now the **Bonus Tile** crawls into view: shiny, smug, and dangerous. Conquer it or cower before it.",
     "🎉 Plot twist! {team} wrapped up **Board {letter}** like they actually planned this. My roast draft is ruined. 🙃\n\n✨ The **Bonus Tile** looms — glorious points, terrible decisions. Will you dare?",
     "🎉 Well, color me startled. {team} bulldozed Board {letter}, all 9 tiles, no survivors. Pathetic… ly effective. 🙃\n\n✨ The **Bonus Tile** enters like a diva, demanding attention. Do you bow, or do you bolt?",
@@ -596,7 +763,7 @@ QUIPS_BONUS_REVEAL = [
     "🎉 So, {team} just… finished Board {letter}? Cute. Unexpected. Mildly offensive to my narrative.\n\n✨ The **Bonus Tile** now waits: high reward, higher risk, maximum judgment. Impress me.",
     "🎉 Breaking news: {team} completed Board {letter}. Scientists baffled. Sarcasm levels critical.\n\n✨ And now the **Bonus Tile** rises — mythical, mocking, and messy. Your destiny awaits.",
     "🎉 Curtain drop! Board {letter} is done, courtesy of {team}. Consider me stunned. Temporarily.\n\n✨ The **Bonus Tile** materializes like a cursed encore. Do you embrace it or storm offstage?",
-]
+)
 
 tile_texts = {
     "A": [
@@ -666,6 +833,28 @@ tile_texts = {
         "Mastering Mixology\n\nPrescription Goggles (can split mox, aga, and lye resin #s across team)\n\n"
     ]
 }
+# Tile lists are never mutated; freeze them so they can be shared safely
+tile_texts = {k: tuple(v) for k, v in tile_texts.items()}
+
+
+def _format_tile(num: int, desc: str) -> str:
+    lines = desc.strip().split("\n")
+    title_line = f"Tile {num} — **{lines[0].strip()}**"
+    bullet_lines = [f"- {line.strip()}" for line in lines[1:] if line.strip()]
+    return "\n".join([title_line] + bullet_lines)
+
+# Checklist entries are static, so format them once per board
+_FORMATTED_TILES = {
+    letter: tuple(_format_tile(i, desc) for i, desc in enumerate(descs, 1))
+    for letter, descs in tile_texts.items()
+}
+_PLACEHOLDER_TILES = tuple(_format_tile(i, "(Placeholder)") for i in range(1, 10))
+
+# First line of each tile (used in the "Tile N: <title> – complete!" line)
+TILE_TITLES = {
+    letter: tuple(t.split("\n", 1)[0] for t in tiles)
+    for letter, tiles in tile_texts.items()
+}
 
 
 # Tile coordinates
@@ -676,18 +865,46 @@ tile_coords = [
 ]
 
 # Helpers
+@functools.lru_cache(maxsize=64)
 def normalize_team_name(name):
     return name.strip().lower()
 
+@functools.lru_cache(maxsize=64)
 def format_team_text(team_key):
     return f"Team {team_key[-1]}"
 
+# channel.id -> (channel name it was resolved from, team key). Seeded in on_ready;
+# a renamed channel simply re-resolves on its next command.
+CHANNEL_TEAM: dict[int, tuple[str, str]] = {}
+
+def channel_team_key(channel) -> str:
+    """Team key for a team channel ("team-1" -> "team1"); may not be a real team."""
+    cached = CHANNEL_TEAM.get(channel.id)
+    if cached is None or cached[0] != channel.name:
+        cached = CHANNEL_TEAM[channel.id] = (channel.name, normalize_team_name(channel.name.replace("-", "")))
+    return cached[1]
+
 def get_current_board_letter(team_key):
     return team_sequences[team_key][game_state[team_key]["board_index"]]
 
-def create_board_image_with_checks(board_letter, completed_tiles):
+@functools.lru_cache(maxsize=None)
+def _load_board_base(board_letter):
+    """Decode + RGBA-convert a board PNG once; callers draw on a copy."""
     img_path = ASSETS_DIR / f"Board {board_letter}.png"
-    img = Image.open(img_path).convert("RGBA")
+    with Image.open(img_path) as src:
+        return src.convert("RGBA")
+
+
+async def render_board(board_letter, completed_tiles) -> bytes:
+    """PNG bytes for a board with checks, rendered on a worker thread so a cold Pillow render
+    doesn't stall other commands. The tile set is snapshotted on the loop first."""
+    return await asyncio.to_thread(_render_board, board_letter, frozenset(completed_tiles))
+
+
+# Each entry is a full PNG (~0.5–1 MB), so keep the working set bounded
+@functools.lru_cache(maxsize=64)
+def _render_board(board_letter, completed_tiles: frozenset) -> bytes:
+    img = _load_board_base(board_letter).copy()
     draw = ImageDraw.Draw(img)
     checkmark_size = 60
     checkmark_width = 10
@@ -707,23 +924,88 @@ def create_board_image_with_checks(board_letter, completed_tiles):
                 # Older Pillow: 'joint' not supported
                 draw.line(points, fill=(0, 255, 0, 255), width=checkmark_width)
 
-    img_bytes = BytesIO()
-    img.save(img_bytes, format="PNG")
-    img_bytes.seek(0)
-    return img_bytes
+    buf = BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
 
 
 def get_tile_descriptions(board_letter, completed_tiles):
-    descriptions = tile_texts.get(board_letter, ["(Placeholder)" for _ in range(9)])
-    display = []
-    for i, desc in enumerate(descriptions):
-        if i + 1 not in completed_tiles:
-            lines = desc.strip().split("\n")
-            title_line = f"Tile {i+1} — **{lines[0].strip()}**"
-            bullet_lines = [f"- {line.strip()}" for line in lines[1:] if line.strip()]
-            full_text = "\n".join([title_line] + bullet_lines)
-            display.append(full_text)
-    return "\n\n".join(display) if display else "*All tiles completed!*"
+    return _tile_descriptions(board_letter, frozenset(completed_tiles))
+
+
+@functools.lru_cache(maxsize=256)
+def _tile_descriptions(board_letter, completed_tiles: frozenset) -> str:
+    formatted = _FORMATTED_TILES.get(board_letter, _PLACEHOLDER_TILES)
+    result = "\n\n".join(t for i, t in enumerate(formatted, 1) if i not in completed_tiles)
+    return result or "*All tiles completed!*"
+
+
+DISCORD_MESSAGE_LIMIT = 2000
+
+# Caps how many board updates upload at once so simultaneous teams don't
+# burst into Discord's global rate limit (and discord.py's 429 backoff)
+MAX_CONCURRENT_SENDS = 4
+_send_sem = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
+async def send_board_message(ctx, text, board_letter, completed_tiles, *, checklist=True, filename="board.png"):
+    """Send text + board image (+ checklist) as a single message.
+    Falls back to text+image, then checklist, if it won't fit in one Discord message."""
+    img_bytes = await render_board(board_letter, completed_tiles)
+    # Fresh BytesIO per send on purpose: discord.File closes its fp after the
+    # upload, so pooled buffers can't be reused. BytesIO(bytes) shares the
+    # cached PNG's buffer until written to, so this doesn't copy the image.
+    file = discord.File(BytesIO(img_bytes), filename=filename)
+
+    if not checklist:
+        async with _send_sem:
+            await ctx.send(content=text, file=file)
+        return
+
+    descriptions = get_tile_descriptions(board_letter, completed_tiles)
+    checklist_block = f"📋 __Board {board_letter} – Checklist__\n\n{descriptions.strip()}"
+    content = f"{text}\n\n{checklist_block}"
+    async with _send_sem:
+        if len(content) <= DISCORD_MESSAGE_LIMIT:
+            await ctx.send(content=content, file=file)
+        else:
+            await ctx.send(content=text, file=file)
+            await ctx.send(checklist_block)
+
+
+def _format_scoreboard(state) -> str:
+    """The 🧮 Points | Bonus Points | Total line for a team's state."""
+    points, bonus = state["points"], state["bonus_points"]
+    return f"🧮 **Points:** {points} | **Bonus Points:** {bonus} | **Total:** {points + bonus}"
+
+
+async def send_board_state(ctx, state, board_letter, *lines, checklist=True, filename="board.png"):
+    """Send `lines` + the team's scoreboard, with the board image (+ checklist) attached."""
+    text = "\n\n".join([*(line for line in lines if line), _format_scoreboard(state)])
+    await send_board_message(ctx, text, board_letter, state["completed_tiles"], checklist=checklist, filename=filename)
+
+
+# guild.id -> (resolved spectator channel ids, time.monotonic() when resolved)
+_spectator_channel_cache: dict[int, tuple[list[int], float]] = {}
+SPECTATOR_CACHE_TTL = 300
+
+
+def _invalidate_spectator_cache(channel):
+    _spectator_channel_cache.pop(channel.guild.id, None)
+
+
+@bot.event
+async def on_guild_channel_create(channel):
+    _invalidate_spectator_cache(channel)
+
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    _invalidate_spectator_cache(channel)
+
+
+@bot.event
+async def on_guild_channel_update(before, after):
+    _invalidate_spectator_cache(after)
 
 
 async def _get_spectator_channels(guild: discord.Guild) -> list[discord.TextChannel]:
@@ -732,6 +1014,12 @@ async def _get_spectator_channels(guild: discord.Guild) -> list[discord.TextChan
         log.info("[spectator] No guild provided")
         return []
 
+    cached = _spectator_channel_cache.get(guild.id)
+    if cached and time.monotonic() - cached[1] < SPECTATOR_CACHE_TTL:
+        chans = [guild.get_channel(cid) for cid in cached[0]]
+        if all(isinstance(ch, discord.TextChannel) for ch in chans):
+            return chans
+
     resolved = []
 
     # 1️⃣ Try each configured channel ID
@@ -753,6 +1041,7 @@ async def _get_spectator_channels(guild: discord.Guild) -> list[discord.TextChan
     if not resolved:
         log.info("[spectator] Could not resolve any spectator channels by ID or name")
 
+    _spectator_channel_cache[guild.id] = ([ch.id for ch in resolved], time.monotonic())
     return resolved
 
 
@@ -785,7 +1074,7 @@ async def spectator_send_text(
         try:
             q = spectator_quip()  # non-repeating, if you added it
         except NameError:
-            q = random.choice(SPECTATOR_QUIPS)
+            q = _rand_choice(SPECTATOR_QUIPS)
         lines.append(f"_{q}_")
 
     if divider:
@@ -800,44 +1089,8 @@ async def spectator_send_text(
             log.warning("[spectator] Failed to send to %s (#%s): %r", getattr(ch, "name", "?"), getattr(ch, "id", "?"), e)
 
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-def spectator_quip() -> str:
-    used = GLOBAL_USED_QUIPS.setdefault("spectator_quips", set())
-    pool = SPECTATOR_QUIPS
-    available = [q for q in pool if q not in used] or pool[:]  # reset when exhausted
-    choice = random.choice(available)
-    used.add(choice)
-    if len(used) >= len(pool):
-        used.clear()
-    return choice
-
-
-
-
-
 # --- Spectator Quip Settings ---
-SPECTATOR_QUIPS = [
+SPECTATOR_QUIPS = (
     "Bingo Betty scribbles something in her imaginary notebook. Probably judgment.",
     "A slow clap echoes through the room. It’s sarcastic. Obviously.",
     "The crowd cheers—Bingo Betty doesn’t.",
@@ -943,7 +1196,14 @@ SPECTATOR_QUIPS = [
     "The crowd claps politely—like at a toddler’s recital.",
     "Even gravity is face-palming.",
     "Bingo Betty whispers, 'Try not to let success scare you.'",
-]
+)
+def _with_spectator_notice(guild: discord.Guild, text: str, send):
+    """Await `send`, overlapped with a spectator notice when announces are on."""
+    if not ENABLE_SPECTATOR_ANNOUNCE:
+        return send
+    return asyncio.gather(spectator_send_text(guild, text), send)
+
+
 async def spectator_tile_completed(guild: discord.Guild, team_key: str, silent: bool = False):
     """Send a public spectator update with a snarky quip for spacing."""
     if silent or not ENABLE_SPECTATOR_ANNOUNCE:
@@ -964,64 +1224,63 @@ async def spectator_tile_completed(guild: discord.Guild, team_key: str, silent:
         log.warning("[spectator] Failed to send spectator message: %r", e)
 
 
-@bot.event
-async def on_command_error(ctx, error):
-    # Unwrap original errors (e.g., CommandInvokeError wraps the real one)
-    original = getattr(error, "original", error)
+# Error type -> reply builder (None = swallow quietly). on_command_error
+# walks type(error).__mro__, so subclasses fall back to their parent's entry.
+_ERROR_REPLIES = {
+    # Unknown commands: stay quiet (prevents noise in public channels)
+    commands.CommandNotFound: None,
+    # Concurrency: pairs with @max_concurrency on tile commands
+    commands.MaxConcurrencyReached: lambda e: "⏳ Slow down—another command is still running here.",
+    # Cooldowns (if you add @commands.cooldown later)
+    commands.CommandOnCooldown: lambda e: f"🧊 Cool it—try again in {e.retry_after:.1f}s.",
+    # Permission / check failures (e.g., is_allowed_admin)
+    commands.MissingPermissions: lambda e: "🛡️ You don’t have permission for that.",
+    commands.CheckFailure: lambda e: "🛡️ You don’t have permission for that.",
+    # Bad / missing args
+    commands.MissingRequiredArgument: lambda e: f"❓ Missing argument: `{e.param.name}`.",
+    commands.BadArgument: lambda e: "❓ That argument didn’t look right. Try again.",
+    # Disabled commands (if you disable any)
+    commands.DisabledCommand: lambda e: "🚫 That command is currently disabled.",
+}
 
-    # 1) Unknown commands: stay quiet (prevents noise in public channels)
-    if isinstance(error, commands.CommandNotFound):
-        return
+# At most one error reply per user every 3s, so spamming a bad command
+# doesn't turn into a reply storm against the channel rate limit.
+_err_cd = commands.CooldownMapping.from_cooldown(1, 3.0, commands.BucketType.user)
 
-    # 2) Concurrency: pairs with @max_concurrency on tile commands
-    if isinstance(error, commands.MaxConcurrencyReached):
-        await ctx.send("⏳ Slow down—another command is still running here.")
-        return
 
-    # 3) Cooldowns (if you add @commands.cooldown later)
-    if isinstance(error, commands.CommandOnCooldown):
-        await ctx.send(f"🧊 Cool it—try again in {error.retry_after:.1f}s.")
-        return
+def _error_reply_throttled(ctx) -> bool:
+    return _err_cd.get_bucket(ctx.message).update_rate_limit() is not None
 
-    # 4) Permission / check failures (e.g., is_allowed_admin)
-    if isinstance(error, commands.MissingPermissions) or isinstance(error, commands.CheckFailure):
-        await ctx.send("🛡️ You don’t have permission for that.")
-        return
 
-    # 5) Bad / missing args
-    if isinstance(error, commands.MissingRequiredArgument):
-        await ctx.send(f"❓ Missing argument: `{error.param.name}`.")
-        return
-    if isinstance(error, commands.BadArgument):
-        await ctx.send("❓ That argument didn’t look right. Try again.")
-        return
+@bot.event
+async def on_command_error(ctx, error):
+    # Unwrap original errors (e.g., CommandInvokeError wraps the real one)
+    original = getattr(error, "original", error)
 
-    # 6) Disabled commands (if you disable any)
-    if isinstance(error, commands.DisabledCommand):
-        await ctx.send("🚫 That command is currently disabled.")
-        return
+    # Most specific handler wins: walk the real error's MRO against the table
+    for cls in type(original).__mro__:
+        if cls in _ERROR_REPLIES:
+            reply = _ERROR_REPLIES[cls]
+            if reply is not None and not _error_reply_throttled(ctx):
+                await ctx.send(reply(original))
+            return
 
-    # 7) Anything else: log details, show a safe generic message
-    log.exception("[command_error] %s in #%s by %s", ctx.command, getattr(ctx.channel, 'name', '?'), ctx.author)
-    await ctx.send("⚠️ Something broke on my end. If it keeps happening, ping an admin.")
+    # Anything else: log details, show a safe generic message
+    log.error(
+        "[command_error] %s in #%s by %s", ctx.command, getattr(ctx.channel, 'name', '?'), ctx.author,
+        exc_info=original,
+    )
+    if not _error_reply_throttled(ctx):
+        await ctx.send("⚠️ Something broke on my end. If it keeps happening, ping an admin.")
 
 
 def spectator_quip() -> str:
     """Return a non-repeating spectator quip; reset when all used."""
     used = GLOBAL_USED_QUIPS.setdefault("spectator_quips", set())
-    pool = SPECTATOR_QUIPS
+    return _pick_unused(SPECTATOR_QUIPS, used)
 
-    # pick from unused, or reset if we've gone through all
-    available = [q for q in pool if q not in used] or pool[:]
-    choice = random.choice(available)
 
-    # mark as used
-    used.add(choice)
-    if len(used) >= len(pool):
-        # optional: auto-reset when all have been seen
-        used.clear()
 
-    return choice
 
 
 
@@ -1034,142 +1293,110 @@ def spectator_quip() -> str:
 
 
 
+# One command object serves !tile1…!tile9; the tile number comes from the invoked alias.
+@bot.command(name="tile1", aliases=[f"tile{i}" for i in range(2, 10)])
+# All nine aliases share this bucket, so queue (wait=True) rather than reject:
+# marking several tiles in quick succession is normal use
+@commands.max_concurrency(1, per=commands.BucketType.channel, wait=True)
+async def tile_command(ctx):
+    tile_num = int(ctx.invoked_with[4:])
+    # infer team from channel name (e.g., "team-1" -> "team1")
+    team_key = channel_team_key(ctx.channel)
 
+    if team_key not in game_state:
+        await ctx.send("Invalid team name.")
+        return
 
+    if not game_state[team_key].get("started"):
+        await ctx.send("Oops! You must start your board using `!startboard` before checking off a tile.")
+        return
 
-def make_tile_command(tile_num):
-    @bot.command(name=f"tile{tile_num}")
-    @commands.max_concurrency(1, per=commands.BucketType.channel, wait=False)
-    async def tile_command(ctx):
-        # infer team from channel name (e.g., "team-1" -> "team1")
-        team_name = ctx.channel.name.replace("-", "")
-        team_key = normalize_team_name(team_name)
+    state = game_state[team_key]
+    board_letter = get_current_board_letter(team_key)
 
-        if team_key not in game_state:
-            await ctx.send("Invalid team name.")
-            return
+    if state.get("finished"):
+        await ctx.send(f"{format_team_text(team_key)} has already completed Bingo Roulette. No further progress can be made.")
+        return
 
-        if not game_state[team_key].get("started"):
-            await ctx.send("Oops! You must start your board using `!startboard` before checking off a tile.")
-            return
+    if state.get("bonus_active"):
+        await ctx.send(f"{format_team_text(team_key)} is currently in a bonus challenge and cannot check tiles.")
+        return
 
-        state = game_state[team_key]
-        board_letter = get_current_board_letter(team_key)
+    if tile_num in state["completed_tiles"]:
+        await ctx.send(f"Tile {tile_num} is already completed for {format_team_text(team_key)}.")
+        return
 
-        if state.get("finished"):
-            await ctx.send(f"{format_team_text(team_key)} has already completed Bingo Roulette. No further progress can be made.")
-            return
+    # --- mutate state ---
+    state["completed_tiles"].add(tile_num)
+    state["points"] += 1
+    mark_state_dirty()
 
-        if state.get("bonus_active"):
-            await ctx.send(f"{format_team_text(team_key)} is currently in a bonus challenge and cannot check tiles.")
-            return
+    if ENABLE_SPECTATOR_ANNOUNCE:
+        await spectator_tile_completed(ctx.guild, team_key)
 
-        if tile_num in state["completed_tiles"]:
-            await ctx.send(f"Tile {tile_num} is already completed for {format_team_text(team_key)}.")
-            return
+    # Pre-build common strings (used by both cases)
+    quip = get_quip(team_key, "tile_complete", QUIPS_TILE_COMPLETE)
 
-        # --- mutate state ---
-        state["completed_tiles"].append(tile_num)
-        state["points"] += 1
-        await save_state(game_state)
+    # ======================
+    # Case 1: all tiles done (final tile)
+    # ======================
+    if len(state["completed_tiles"]) == 9:
+        if not state.get("looped", False):
+            # First cycle → trigger bonus tile
+            state["bonus_active"] = True
+            mark_state_dirty()
+
+            # spectator notice (no bonus details) goes to another channel, so it
+            # can overlap with 1) action + quip + scoreboard + 2) board image (all checks)
+            await _with_spectator_notice(
+                ctx.guild,
+                f"🏁 **{format_team_text(team_key)}** has completed a board.",
+                send_board_state(
+                    ctx, state, board_letter,
+                    f"🎉 {format_team_text(team_key)} has completed all 9 tiles and has finished Board {board_letter}!",
+                    quip,
+                    checklist=False,
+                ),
+            )
+
+            # 3) Bonus intro + challenge + instructions (LAST)
+            await ctx.send(BONUS_MESSAGES[board_letter])
+            return
 
-        await spectator_tile_completed(ctx.guild, team_key)
+        else:
+            # Loop cycle → no bonus; advance immediately
+            state["board_index"] = (state["board_index"] + 1) % len(team_sequences[team_key])
+            state["completed_tiles"] = set()
+            mark_state_dirty()
+
+            # spectator notice (loop cycle board completion) overlaps with the
+            # action + quip + scoreboard, new board image + checklist (single send)
+            await _with_spectator_notice(
+                ctx.guild,
+                f"🏁 **{format_team_text(team_key)}** has completed a board.",
+                send_board_state(
+                    ctx, state, get_current_board_letter(team_key),
+                    f"🎉 {format_team_text(team_key)} has completed all 9 tiles on Board {board_letter}!",
+                    f"🗣️ Bingo Betty says: *\"No encore Bonus Tile for you. You've already seen that show. Onward. Also take a shower... ew.\"*",
+                ),
+            )
+            return
 
-        # Pre-build common strings (used by both cases)
-        check_emoji = "✅"
-        # If your tile_texts structure differs, keep your existing lookup
-        tile_title = tile_texts[board_letter][tile_num - 1].split("\n")[0]
-        quip = get_quip(team_key, "tile_complete", QUIPS_TILE_COMPLETE)
-        points_line = (
-            f"🧮 **Points:** {state['points']} | **Bonus Points:** {state['bonus_points']} | "
-            f"**Total:** {state['points'] + state['bonus_points']}"
-        )
-        action_line = f"{check_emoji} **Tile {tile_num}: {tile_title} – complete!** +1 point awarded."
-        combined_text = f"{action_line}\n\n{quip}\n\n{points_line}"
-
-        # ======================
-        # Case 1: all tiles done (final tile)
-        # ======================
-        if len(state["completed_tiles"]) == 9:
-            if not state.get("looped", False):
-                # First cycle → trigger bonus tile
-                state["bonus_active"] = True
-                await save_state(game_state)
-
-                # spectator notice (no bonus details)
-                await spectator_send_text(ctx.guild, f"🏁 **{format_team_text(team_key)}** has completed a board.")
-
-
-                # 1) Combined: action + quip + scoreboard (moved above image)
-                await ctx.send(
-                    f"🎉 {format_team_text(team_key)} has completed all 9 tiles and has finished Board {board_letter}!\n\n"
-                    f"{quip}\n\n"
-                    f"{points_line}"
-                )
-
-                # 2) Board image (all checks)
-                img_bytes = create_board_image_with_checks(board_letter, state["completed_tiles"])
-                await ctx.send(file=discord.File(img_bytes, filename="board.png"))
-
-                # 3) Bonus intro + challenge + instructions (LAST)
-                raw_bonus = bonus_challenges[board_letter].replace("/n", "\n")
-                challenge_block = "> " + "\n> ".join(raw_bonus.splitlines())
-                await ctx.send(
-                    "🔮 **A wild Bonus Tile has appeared!**\n"
-                    f"{challenge_block}\n"
-                    "\n"
-                    "- Type `!finishbonus` when you have completed the Bonus Tile challenge.\n"
-                    "- Or, type `!skipbonus` to skip the Bonus Tile and move to the next board."
-                )
-                return
+    # ======================
+    # Case 2: normal progress (board not complete yet)
+    # ======================
+    check_emoji = "✅"
+    tile_title = TILE_TITLES[board_letter][tile_num - 1]
+    action_line = f"{check_emoji} **Tile {tile_num}: {tile_title} – complete!** +1 point awarded."
 
-            else:
-                # Loop cycle → no bonus; advance immediately
-                # 1) Combined: action + quip + scoreboard (before advancing image)
-                await ctx.send(
-                    f"🎉 {format_team_text(team_key)} has completed all 9 tiles on Board {board_letter}!\n\n"
-                    f"🗣️ Bingo Betty says: *\"No encore Bonus Tile for you. You've already seen that show. Onward. Also take a shower... ew.\"*\n\n"
-                    f"{points_line}"
-                )
-                # spectator notice (loop cycle board completion)
-                await spectator_send_text(ctx.guild, f"🏁 **{format_team_text(team_key)}** has completed a board.")
-
-
-                # Advance and reset
-                state["board_index"] = (state["board_index"] + 1) % len(team_sequences[team_key])
-                state["completed_tiles"] = []
-                await save_state(game_state)
-
-                # 2) New board image
-                board_letter = get_current_board_letter(team_key)
-                img_bytes = create_board_image_with_checks(board_letter, [])
-                await ctx.send(file=discord.File(img_bytes, filename="board.png"))
-
-                # 3) Checklist LAST
-                descriptions = get_tile_descriptions(board_letter, [])
-                await ctx.send(f"📋 __Board {board_letter} – Checklist__\n\n{descriptions}")
-                return
-
-        # ======================
-        # Case 2: normal progress (board not complete yet)
-        # ======================
-        # 1) Combined text (action + quip + scoreboard)
-        await ctx.send(combined_text)
-
-        # 2) Board image
-        img_bytes = create_board_image_with_checks(board_letter, state["completed_tiles"])
-        await ctx.send(file=discord.File(img_bytes, filename="board.png"))
-
-        # 3) Remaining checklist LAST
-        descriptions = get_tile_descriptions(board_letter, state["completed_tiles"])
-        descriptions = get_tile_descriptions(board_letter, state["completed_tiles"])
-        await ctx.send(f"📋 __Board {board_letter} – Checklist__\n\n{descriptions.strip()}\n")
+    # Combined text (action + quip + scoreboard) + board image + remaining checklist
+    await send_board_state(ctx, state, board_letter, action_line, quip)
 
 # ------- Admin: remove a completed tile -------
 @is_allowed_admin()
 @bot.command()
 async def removetile(ctx, tile: int):
-    team_key = normalize_team_name(ctx.channel.name.replace("-", ""))
+    team_key = channel_team_key(ctx.channel)
     if team_key not in game_state:
         await ctx.send("Invalid team name.")
         return
@@ -1191,51 +1418,18 @@ async def removetile(ctx, tile: int):
 
     board_letter = get_current_board_letter(team_key)
 
-    # Ensure completed_tiles is a list (never a set)
-    if isinstance(state.get("completed_tiles"), set):
-        state["completed_tiles"] = list(state["completed_tiles"])
-
     # If tile wasn't completed, just report it and show the normal view in your order
     if tile not in state["completed_tiles"]:
-        # 1) action
-        await ctx.send(
-            f"⚠️ Tile {tile} was not marked complete for {format_team_text(team_key)} on **Board {board_letter}**."
+        # action + quip (fallback to progress quips) + scoreboard, board image, checklist
+        await send_board_state(
+            ctx, state, board_letter,
+            f"⚠️ Tile {tile} was not marked complete for {format_team_text(team_key)} on **Board {board_letter}**.",
+            get_quip(team_key, "removetile", QUIPS_PROGRESS),
         )
-        # 2) quip (fallback to progress quips)
-        quip = get_quip(team_key, "removetile", QUIPS_PROGRESS)
-        await ctx.send(quip)
-        # 3) scoreboard
-        await ctx.send(
-            f"🧮 **Points:** {state['points']} | **Bonus Points:** {state['bonus_points']} | "
-            f"**Total:** {state['points'] + state['bonus_points']}"
-        )
-        # 4) board image
-        img_bytes = create_board_image_with_checks(board_letter, state["completed_tiles"])
-        await ctx.send(file=discord.File(img_bytes, filename="board.png"))
-        # 5) checklist
-        descriptions = get_tile_descriptions(board_letter, state["completed_tiles"])
-        await ctx.send(f"📋 __Board {board_letter} – Checklist__\n\n{descriptions}")
         return
 
-    # --- actually remove the tile (list-safe) ---
-    try:
-        state["completed_tiles"].remove(tile)
-    except ValueError:
-        # If it somehow isn't there, fall back to the "not completed" flow
-        await ctx.send(
-            f"⚠️ Tile {tile} was not marked complete for {format_team_text(team_key)} on **Board {board_letter}**."
-        )
-        quip = get_quip(team_key, "removetile", QUIPS_PROGRESS)
-        await ctx.send(quip)
-        await ctx.send(
-            f"🧮 **Points:** {state['points']} | **Bonus Points:** {state['bonus_points']} | "
-            f"**Total:** {state['points'] + state['bonus_points']}"
-        )
-        img_bytes = create_board_image_with_checks(board_letter, state["completed_tiles"])
-        await ctx.send(file=discord.File(img_bytes, filename="board.png"))
-        descriptions = get_tile_descriptions(board_letter, state["completed_tiles"])
-        await ctx.send(f"📋 __Board {board_letter} – Checklist__\n\n{descriptions}")
-        return
+    # --- actually remove the tile ---
+    state["completed_tiles"].discard(tile)
 
     # adjust points safely (1 point per tile)
     if state.get("points", 0) > 0:
@@ -1246,46 +1440,27 @@ async def removetile(ctx, tile: int):
         state["bonus_active"] = False
 
     # persist mutation
-    await save_state(game_state)
-
-    # ----- Ordered output -----
-    # 1) action
-    await ctx.send(
-        f"⛔️ **Tile {tile} removed.** {format_team_text(team_key)} progress updated on **Board {board_letter}**."
+    mark_state_dirty()
+
+    # ----- Ordered output (single send) -----
+    # action + quip + scoreboard, board image, checklist
+    await send_board_state(
+        ctx, state, board_letter,
+        f"⛔️ **Tile {tile} removed.** {format_team_text(team_key)} progress updated on **Board {board_letter}**.",
+        get_quip(team_key, "removetile", QUIPS_TILE_REMOVE),
     )
 
-    # 2) quip
-    quip = get_quip(team_key, "removetile", QUIPS_TILE_REMOVE if 'QUIPS_TILE_REMOVE' in globals() else QUIPS_PROGRESS)
-    await ctx.send(quip)
-
-    # 3) scoreboard
-    await ctx.send(
-        f"🧮 **Points:** {state['points']} | **Bonus Points:** {state['bonus_points']} | "
-        f"**Total:** {state['points'] + state['bonus_points']}"
-    )
 
-    # 4) board image
-    img_bytes = create_board_image_with_checks(board_letter, state["completed_tiles"])
-    await ctx.send(file=discord.File(img_bytes, filename="board.png"))
 
-    # 5) checklist
-    descriptions = get_tile_descriptions(board_letter, state["completed_tiles"])
-    await ctx.send(f"📋 __Board {board_letter} – Checklist__\n\n{descriptions}")
 
 
 
 
-
-# Register tile commands
-for tile_num in range(1, 10):
-    make_tile_command(tile_num)
-
-
 @bot.command(hidden=True)
 @is_allowed_admin()
 async def tileall(ctx, *, team: str):
     team_key = normalize_team_name(team)
-    if team_key not in game_state:
+    if team_key not in TEAM_KEYS:
         await ctx.send("Invalid team name.")
         return
 
@@ -1294,65 +1469,40 @@ async def tileall(ctx, *, team: str):
 
     # how many tiles left on this board?
     remaining = max(0, 9 - len(state["completed_tiles"]))
-    state["completed_tiles"] = list(range(1, 10))
+    state["completed_tiles"] = set(range(1, 10))
     state["points"] += remaining
 
-    # 👇 add this one line (silences spectator broadcast for tileall)
-    await spectator_tile_completed(ctx.guild, team_key, silent=True)
+    # tileall never broadcasts to spectators (was a silent=True no-op call)
 
     if not state.get("looped", False):
         # First cycle → trigger bonus tile
         state["bonus_active"] = True
+        mark_state_dirty()
 
-        # 1) Announcement + 2) Scoreboard (single send) — NO QUIP
-        await ctx.send(
-            f"🎉 {format_team_text(team_key)} has completed all 9 tiles and has finished Board {board_letter}!\n\n"
-            f"🧮 **Points:** {state['points']} | **Bonus Points:** {state['bonus_points']} | "
-            f"**Total:** {state['points'] + state['bonus_points']}"
-        )
-
-        # 3) Board image
-        img_bytes = create_board_image_with_checks(board_letter, state["completed_tiles"])
-        await ctx.send(file=discord.File(img_bytes, filename="board.png"))
-
+        # 1) Announcement + 2) Scoreboard + 3) Board image (single send) — NO QUIP
         # 🚫 No checklist here because the board has 9 checks
+        await send_board_state(
+            ctx, state, board_letter,
+            f"🎉 {format_team_text(team_key)} has completed all 9 tiles and has finished Board {board_letter}!",
+            checklist=False,
+        )
 
         # 4) Bonus challenge LAST (one clean blank line before instructions)
-        raw_bonus = bonus_challenges[board_letter].replace("/n", "\n")
-        challenge_block = "> " + "\n> ".join(raw_bonus.splitlines())
-        await ctx.send(
-            "🔮 **A wild Bonus Tile has appeared!**\n\n"
-            f"{challenge_block}\n\n"
-            "- Type `!finishbonus` when you have completed the Bonus Tile challenge.\n"
-            "- Or, type `!skipbonus` to skip the Bonus Tile and move to the next board."
-        )
+        await ctx.send(BONUS_MESSAGES[board_letter])
 
     else:
         # Loop cycle → no bonus tile; advance directly
         state["board_index"] = (state["board_index"] + 1) % len(team_sequences[team_key])
-        state["completed_tiles"] = []
-
-        # 1) Announcement + 2) Scoreboard (single send) — NO QUIP
-        await ctx.send(
-            f"🎉 {format_team_text(team_key)} has completed all 9 tiles on Board {board_letter}!\n\n"
-            f"🧮 **Points:** {state['points']} | **Bonus Points:** {state['bonus_points']} | "
-            f"**Total:** {state['points'] + state['bonus_points']}"
+        state["completed_tiles"] = set()
+        mark_state_dirty()
+
+        # Announcement + scoreboard — NO QUIP — with the fresh board image and
+        # the new board's checklist (now it's ok to show), single send
+        await send_board_state(
+            ctx, state, get_current_board_letter(team_key),
+            f"🎉 {format_team_text(team_key)} has completed all 9 tiles on Board {board_letter}!",
         )
 
-        # New current board after advancing
-        board_letter = get_current_board_letter(team_key)
-
-        # 3) Board image (fresh)
-        img_bytes = create_board_image_with_checks(board_letter, [])
-        await ctx.send(file=discord.File(img_bytes, filename="board.png"))
-
-        # 4) Checklist for the new board (now it's ok to show)
-        descriptions = get_tile_descriptions(board_letter, [])
-        await ctx.send(f"📋 __Board {board_letter} – Checklist__\n\n{descriptions}")
-
-    # persist mutations from either branch
-    await save_state(game_state)
-
 
 
 
@@ -1361,7 +1511,7 @@ async def tileall(ctx, *, team: str):
 @bot.command()
 @commands.max_concurrency(1, per=commands.BucketType.channel, wait=False)
 async def startboard(ctx):
-    team_key = normalize_team_name(ctx.channel.name.replace("-", ""))
+    team_key = channel_team_key(ctx.channel)
     if team_key not in game_state:
         await ctx.send("Invalid team name.")
         return
@@ -1387,11 +1537,11 @@ async def startboard(ctx):
 
     # First-time start: set flags BEFORE awaits, then persist
     state["started"] = True
-    state.setdefault("completed_tiles", [])
+    state.setdefault("completed_tiles", set())
     state.setdefault("points", 0)
     state.setdefault("bonus_points", 0)
     state["bonus_active"] = False
-    await save_state(game_state)
+    mark_state_dirty()
 
     # 🔊 Quip with emoji + "Bingo Betty says" via get_quip (non-repeating)
     td = format_team_text(team_key)               # e.g., "Team 1"
@@ -1401,37 +1551,23 @@ async def startboard(ctx):
         "start_board",  # category key for non-repeat tracking
         [q.format(letter=board_letter, team=team_num) for q in QUIPS_START_BOARD]
     )
-    # get_quip returns: 🗣️ Bingo Betty says: *"…formatted quip…"*
-
-    points_line = (
-        f"🧮 **Points:** {state['points']} | **Bonus Points:** {state['bonus_points']} | "
-        f"**Total:** {state['points'] + state['bonus_points']}"
-    )
 
-    # 1) announcement + 2) quip + 3) scoreboard (single send)
-    await ctx.send(
+    # announcement + quip + scoreboard, board image, checklist (single send)
+    await send_board_state(
+        ctx, state, board_letter,
         f"🔥 **Welcome to Bingo Roulette, {format_team_text(team_key)}. "
-        f"Your first board, Board {board_letter}, is now active!** ✅\n\n"
-        f"{quip}\n\n"
-        f"{points_line}"
+        f"Your first board, Board {board_letter}, is now active!** ✅",
+        quip,
+        filename=f"board_{board_letter}.png",
     )
 
-    # 4) board image
-    img_bytes = create_board_image_with_checks(board_letter, state["completed_tiles"])
-    await ctx.send(file=discord.File(img_bytes, filename=f"board_{board_letter}.png"))
-
-    # 5) checklist
-    descriptions = get_tile_descriptions(board_letter, state["completed_tiles"])
-    await ctx.send(f"📋 __Board {board_letter} – Checklist__\n\n{descriptions}")
-
 
 
 
 # ------- Finish bonus (infer team) -------
 @bot.command()
 async def finishbonus(ctx):
-    team_name = ctx.channel.name.replace("-", "")
-    team_key = normalize_team_name(team_name)
+    team_key = channel_team_key(ctx.channel)
 
     if team_key not in game_state:
         await ctx.send("Invalid team name.")
@@ -1458,7 +1594,7 @@ async def finishbonus(ctx):
     if not state.get("bonus_active"):
         if len(state.get("completed_tiles", [])) == 9 and not state.get("looped", False):
             state["bonus_active"] = True
-            await save_state(game_state)
+            mark_state_dirty()
         else:
             await ctx.send(f"{format_team_text(team_key)} is not currently in a bonus challenge.")
             return
@@ -1470,34 +1606,22 @@ async def finishbonus(ctx):
         state["looped"] = True
         state["board_index"] = 0
 
-    state["completed_tiles"] = []
+    state["completed_tiles"] = set()
     state["bonus_active"] = False
-    await save_state(game_state)
+    mark_state_dirty()
 
     board_letter = get_current_board_letter(team_key)
 
     # 🎉 Combined first send: Announcement + Quip + Refs note + 🧮 Scoreboard
     quip = get_quip(team_key, "bonus_complete", QUIPS_BONUS_COMPLETE)
-    points_line = (
-        f"🧮 **Points:** {state['points']} | **Bonus Points:** {state['bonus_points']} | "
-        f"**Total:** {state['points'] + state['bonus_points']}"
-    )
-    msg = (
-        f"🎉 {format_team_text(team_key)} has completed the Bonus Tile challenge and advanced to Board {board_letter}!\n\n"
-        f"{quip}\n\n"
+    # 🖼️ Board image + ✅ checklist ride along in the same send
+    await send_board_state(
+        ctx, state, board_letter,
+        f"🎉 {format_team_text(team_key)} has completed the Bonus Tile challenge and advanced to Board {board_letter}!",
+        quip,
         "📝 Refs will verify that the Bonus Tile Challenge has successfully been completed. "
-        "If approved, your bonus points will be manually added! (Please tag the refs!)\n\n"
-        f"{points_line}"
+        "If approved, your bonus points will be manually added! (Please tag the refs!)",
     )
-    await ctx.send(msg)
-
-    # 🖼️ Board image (separate send)
-    img_bytes = create_board_image_with_checks(board_letter, [])
-    await ctx.send(file=discord.File(img_bytes, filename="board.png"))
-
-    # ✅ Checklist (separate send, underlined header with spacing)
-    descriptions = get_tile_descriptions(board_letter, [])
-    await ctx.send(f"📋 __Board {board_letter} – Checklist__\n\n{descriptions}")
 
 
 
@@ -1505,8 +1629,7 @@ async def finishbonus(ctx):
 
 @bot.command()
 async def skipbonus(ctx):
-    team_name = ctx.channel.name.replace("-", "")
-    team_key = normalize_team_name(team_name)
+    team_key = channel_team_key(ctx.channel)
 
     if team_key not in game_state:
         await ctx.send("Invalid team name.")
@@ -1531,7 +1654,7 @@ async def skipbonus(ctx):
     if not state.get("bonus_active"):
         if len(state.get("completed_tiles", [])) == 9 and not state.get("looped", False):
             state["bonus_active"] = True
-            await save_state(game_state)
+            mark_state_dirty()
         else:
             await ctx.send(f"{format_team_text(team_key)} is not currently in a bonus challenge.")
             return
@@ -1543,33 +1666,21 @@ async def skipbonus(ctx):
         state["looped"] = True
         state["board_index"] = 0
 
-    state["completed_tiles"] = []
+    state["completed_tiles"] = set()
     state["bonus_active"] = False
-    await save_state(game_state)
+    mark_state_dirty()
 
     board_letter = get_current_board_letter(team_key)
 
     # 🎯 Combined first send: announcement + quip + scoreboard
     quip = get_quip(team_key, "bonus_skip", QUIPS_BONUS_SKIP)
-    points_line = (
-        f"🧮 **Points:** {state['points']} | **Bonus Points:** {state['bonus_points']} | "
-        f"**Total:** {state['points'] + state['bonus_points']}"
-    )
-    msg = (
+    # 🖼️ Board image + 📋 checklist ride along in the same send
+    await send_board_state(
+        ctx, state, board_letter,
         f"🚪 {format_team_text(team_key)} has skipped the Bonus Tile Challenge and advanced to Board {board_letter}. "
-        f"No bonus points will be awarded.\n\n"
-        f"{quip}\n\n"
-        f"{points_line}"
+        "No bonus points will be awarded.",
+        quip,
     )
-    await ctx.send(msg)
-
-    # 🖼️ Board image (separate send)
-    img_bytes = create_board_image_with_checks(board_letter, [])
-    await ctx.send(file=discord.File(img_bytes, filename="board.png"))
-
-    # 📋 Checklist (separate send, underlined header + spacing)
-    descriptions = get_tile_descriptions(board_letter, [])
-    await ctx.send(f"📋 __Board {board_letter} – Checklist__\n\n{descriptions}")
 
 
 
@@ -1579,19 +1690,9 @@ async def skipbonus(ctx):
 @is_allowed_admin()
 async def reset(ctx, *, team: str):
     team_key = normalize_team_name(team)
-    if team_key in game_state:
-        game_state[team_key] = {
-            "board_index": 0,
-            "completed_tiles": [],
-            "bonus_active": False,
-            "points": 0,
-            "bonus_points": 0,
-            "started": False,
-            "used_quips": {},
-            "looped": False,  # <-- ensure present
-            "finished": False,   # 👈 add this
-        }
-        await save_state(game_state)
+    if team_key in TEAM_KEYS:
+        game_state[team_key] = _fresh_team_state()
+        mark_state_dirty()
         await ctx.send(f"{format_team_text(team_key)} has been reset.")
 
 
@@ -1600,35 +1701,19 @@ async def reset(ctx, *, team: str):
 @is_allowed_admin()
 async def resetall(ctx):
     global LAST_RESETALL_CALL
-    now = time.time()
+    now = time.monotonic()  # immune to wall-clock jumps
     if now - LAST_RESETALL_CALL < 1.0:
         return
     LAST_RESETALL_CALL = now
 
-    for key in list(game_state.keys()):
-        game_state[key] = {
-            "board_index": 0,
-            "completed_tiles": [],
-            "bonus_active": False,
-            "points": 0,
-            "bonus_points": 0,
-            "started": False,
-            "used_quips": {},
-            "looped": False,  # <-- ensure present
-            "finished": False,   # 👈 add this
-        }
+    for key in game_state:
+        game_state[key] = _fresh_team_state()
 
-    await save_state(game_state)
+    mark_state_dirty()
 
 
     try:
-        msg = get_quip("global", "resetall", [
-            "Global reset executed. Fresh chaos unlocked. Don’t make me regret this.",
-            "All teams scrubbed clean. Like it never happened. Except I remember everything.",
-            "Factory settings restored. Perform better in the sequel, please.",
-            "We nuked it from orbit. Only way to be sure. Proceed.",
-            "Clean slate delivered. Try not to smudge it immediately.",
-        ])
+        msg = get_quip("global", "resetall", QUIPS_RESETALL)
         await ctx.send(msg)
     except Exception:
         await ctx.send("⚙️ **All teams have been reset.**")
@@ -1639,7 +1724,7 @@ async def resetall(ctx):
 @is_allowed_admin()
 async def setboard(ctx, board_letter: str, team: str):
     team_key = normalize_team_name(team)
-    if team_key not in game_state:
+    if team_key not in TEAM_KEYS:
         await ctx.send("Invalid team name.")
         return
 
@@ -1647,16 +1732,22 @@ async def setboard(ctx, board_letter: str, team: str):
         await ctx.send("Invalid board letter.")
         return
 
-    game_state[team_key]["board_index"] = team_sequences[team_key].index(board_letter.upper())
-    game_state[team_key]["completed_tiles"] = []
-    game_state[team_key]["bonus_active"] = False
-    game_state[team_key]["started"] = True  # ✅ added line
-    await save_state(game_state)
+    state = game_state[team_key]
+    new_index = team_sequences[team_key].index(board_letter.upper())
+    # Re-setting a team to the fresh board it's already on changes nothing: skip the save
+    if (state["board_index"], state["completed_tiles"], state["bonus_active"], state.get("started")) != (
+        new_index, set(), False, True
+    ):
+        state["board_index"] = new_index
+        state["completed_tiles"] = set()
+        state["bonus_active"] = False
+        state["started"] = True  # ✅ added line
+        mark_state_dirty()
 
 
-    img_bytes = create_board_image_with_checks(board_letter.upper(), [])
+    img_bytes = await render_board(board_letter.upper(), [])
     await ctx.send(f"Admin override: {format_team_text(team_key)} set to Board {board_letter.upper()}.")
-    await ctx.send(file=discord.File(img_bytes, filename="board.png"))
+    await ctx.send(file=discord.File(BytesIO(img_bytes), filename="board.png"))
 
 
 # ------- Admin: force next board -------
@@ -1664,137 +1755,84 @@ async def setboard(ctx, board_letter: str, team: str):
 @is_allowed_admin()
 async def setnextboard(ctx, *, team: str):
     team_key = normalize_team_name(team)
-    if team_key not in game_state:
+    if team_key not in TEAM_KEYS:
         await ctx.send("Invalid team name.")
         return
 
     state = game_state[team_key]
     if state["board_index"] + 1 < len(team_sequences[team_key]):
         state["board_index"] += 1
-        state["completed_tiles"] = []
+        state["completed_tiles"] = set()
         state["bonus_active"] = False
         state["started"] = True  # ✅ make sure team can immediately use tiles
-        await save_state(game_state)
+        mark_state_dirty()
 
 
         board_letter = get_current_board_letter(team_key)
-        img_bytes = create_board_image_with_checks(board_letter, [])
+        img_bytes = await render_board(board_letter, [])
         await ctx.send(f"Admin override: {format_team_text(team_key)} skipped to next board ({board_letter}).")
-        await ctx.send(file=discord.File(img_bytes, filename="board.png"))
+        await ctx.send(file=discord.File(BytesIO(img_bytes), filename="board.png"))
     else:
         await ctx.send(f"{format_team_text(team_key)} has no more boards left.")
 
 
 # ------- Admin: adjust points -------
-@bot.command(hidden=True)
-@is_allowed_admin()
-async def addpoints(ctx, amount: int, team: str):
+async def _adjust_points(ctx, amount: int, team: str, field: str, *, add: bool, quips):
+    """Shared body of the four admin points commands: mutate, save, announce."""
     team_key = normalize_team_name(team)
-    if team_key not in game_state:
+    if team_key not in TEAM_KEYS:
         await ctx.send("Invalid team name.")
         return
 
-    game_state[team_key]["points"] += amount
-    await save_state(game_state)
-
-
-    total = game_state[team_key]["points"] + game_state[team_key]["bonus_points"]
-    quip = random.choice(QUIPS_ADMIN_ADD_TILE).format(amount=amount, team=format_team_text(team_key))
-
-    msg = (
-        f"✅ **{amount} points have been added to {format_team_text(team_key)}.**\n\n"
+    state = game_state[team_key]
+    new_value = state[field] + amount if add else max(0, state[field] - amount)
+    if new_value != state[field]:  # e.g. removing from 0, or amount 0: nothing to save
+        state[field] = new_value
+        mark_state_dirty()
+
+    team_text = format_team_text(team_key)
+    quip = _rand_choice(quips).format(amount=amount, team=team_text)
+    label = "points" if field == "points" else "bonus points"
+    headline = (
+        f"✅ **{amount} {label} have been added to {team_text}.**" if add
+        else f"❌ **{amount} {label} have been removed from {team_text}.**"
+    )
+    await ctx.send(
+        f"{headline}\n\n"
         f"🗣️ Bingo Betty says: *\"{quip}\"*\n\n"
-        f"🧮 **Points:** {game_state[team_key]['points']} | "
-        f"**Bonus Points:** {game_state[team_key]['bonus_points']} | "
-        f"**Total:** {total}"
+        f"{_format_scoreboard(state)}"
     )
-    await ctx.send(msg)
 
 
 @bot.command(hidden=True)
 @is_allowed_admin()
-async def removepoints(ctx, amount: int, team: str):
-    team_key = normalize_team_name(team)
-    if team_key not in game_state:
-        await ctx.send("Invalid team name.")
-        return
-
-    game_state[team_key]["points"] = max(0, game_state[team_key]["points"] - amount)
-    await save_state(game_state)
-
-
-    total = game_state[team_key]["points"] + game_state[team_key]["bonus_points"]
-    quip = random.choice(QUIPS_ADMIN_REMOVE_TILE).format(amount=amount, team=format_team_text(team_key))
+async def addpoints(ctx, amount: int, team: str):
+    await _adjust_points(ctx, amount, team, "points", add=True, quips=QUIPS_ADMIN_ADD_TILE)
 
-    msg = (
-        f"❌ **{amount} points have been removed from {format_team_text(team_key)}.**\n\n"
-        f"🗣️ Bingo Betty says: *\"{quip}\"*\n\n"
-        f"🧮 **Points:** {game_state[team_key]['points']} | "
-        f"**Bonus Points:** {game_state[team_key]['bonus_points']} | "
-        f"**Total:** {total}"
-    )
-    await ctx.send(msg)
 
+@bot.command(hidden=True)
+@is_allowed_admin()
+async def removepoints(ctx, amount: int, team: str):
+    await _adjust_points(ctx, amount, team, "points", add=False, quips=QUIPS_ADMIN_REMOVE_TILE)
 
 
 @bot.command(hidden=True)
 @is_allowed_admin()
 async def addbonuspoints(ctx, amount: int, team: str):
-    team_key = normalize_team_name(team)
-    if team_key not in game_state:
-        await ctx.send("Invalid team name.")
-        return
-
-    game_state[team_key]["bonus_points"] += amount
-    await save_state(game_state)
-
-
-    total = game_state[team_key]["points"] + game_state[team_key]["bonus_points"]
-    quip = random.choice(QUIPS_ADMIN_ADD).format(amount=amount, team=format_team_text(team_key))
-
-    msg = (
-        f"✅ **{amount} bonus points have been added to {format_team_text(team_key)}.**\n\n"
-        f"🗣️ Bingo Betty says: *\"{quip}\"*\n\n"
-        f"🧮 **Points:** {game_state[team_key]['points']} | "
-        f"**Bonus Points:** {game_state[team_key]['bonus_points']} | "
-        f"**Total:** {total}"
-    )
-    await ctx.send(msg)
-
-
+    await _adjust_points(ctx, amount, team, "bonus_points", add=True, quips=QUIPS_ADMIN_ADD)
 
 
 @bot.command(hidden=True)
 @is_allowed_admin()
 async def removebonuspoints(ctx, amount: int, team: str):
-    team_key = normalize_team_name(team)
-    if team_key not in game_state:
-        await ctx.send("Invalid team name.")
-        return
-
-    game_state[team_key]["bonus_points"] = max(0, game_state[team_key]["bonus_points"] - amount)
-    await save_state(game_state)
-
-
-    total = game_state[team_key]["points"] + game_state[team_key]["bonus_points"]
-    quip = random.choice(QUIPS_ADMIN_REMOVE).format(amount=amount, team=format_team_text(team_key))
-
-    msg = (
-        f"❌ **{amount} bonus points have been removed from {format_team_text(team_key)}.**\n\n"
-        f"🗣️ Bingo Betty says: *\"{quip}\"*\n\n"
-        f"🧮 **Points:** {game_state[team_key]['points']} | "
-        f"**Bonus Points:** {game_state[team_key]['bonus_points']} | "
-        f"**Total:** {total}"
-    )
-    await ctx.send(msg)
+    await _adjust_points(ctx, amount, team, "bonus_points", add=False, quips=QUIPS_ADMIN_REMOVE)
 
 
 
 # ------- Show team progress -------
 @bot.command()
 async def progress(ctx):
-    team_name = ctx.channel.name.replace("-", "")
-    team_key = normalize_team_name(team_name)
+    team_key = channel_team_key(ctx.channel)
 
     if team_key not in game_state:
         await ctx.send("Invalid team name.")
@@ -1815,52 +1853,30 @@ async def progress(ctx):
     board_letter = get_current_board_letter(team_key)
 
     # If bonus is active, re-show the bonus screen in this order:
-    # 1) completed message + points (single send), 2) board image, 3) bonus header + challenge + instructions (last)
+    # 1) completed message + points + board image (single send), 2) bonus header + challenge + instructions (last)
     if state.get("bonus_active"):
-        # 1) completed message + points (SCOREBOARD BEFORE IMAGE)
-        completed_msg = f"🎉 {format_team_text(team_key)} has completed all 9 tiles and has finished Board {board_letter}!\n"
-        points_line = (
-            f"🧮 **Points:** {state['points']} | **Bonus Points:** {state['bonus_points']} | "
-            f"**Total:** {state['points'] + state['bonus_points']}"
+        # 1) completed message + points (SCOREBOARD BEFORE IMAGE) with the board attached
+        await send_board_state(
+            ctx, state, board_letter,
+            f"🎉 {format_team_text(team_key)} has completed all 9 tiles and has finished Board {board_letter}!",
+            checklist=False,
         )
-        await ctx.send("\n".join([completed_msg, points_line]))
-
-        # 2) board image
-        img_bytes = create_board_image_with_checks(board_letter, state["completed_tiles"])
-        await ctx.send(file=discord.File(img_bytes, filename="board.png"))
 
-        # 3) bonus last
-        raw_bonus = bonus_challenges[board_letter].replace("/n", "\n")
-        challenge_block = "> " + "\n> ".join(raw_bonus.splitlines())
-        await ctx.send(
-            f"🔮 **A wild Bonus Tile has appeared!**\n\n"
-            f"{challenge_block}\n\n"
-            "- Type `!finishbonus` when you have completed the Bonus Tile challenge.\n"
-            "- Or, type `!skipbonus` to skip the Bonus Tile and move to the next board."
-        )
+        # 2) bonus last (prebuilt per board)
+        await ctx.send(BONUS_MESSAGES[board_letter])
         return
 
     # --- normal progress view ---
     # Order: action line, quip, SCOREBOARD, board image, checklist
     quip = get_quip(team_key, "progress", QUIPS_PROGRESS)
 
-    # 1) Action line + 2) quip + 3) scoreboard (single send)
-    await ctx.send(
-        "📊 **Progress update** for "
-        f"{format_team_text(team_key)} on **Board {board_letter}**\n\n"
-        f"{quip}\n\n"
-        f"🧮 **Points:** {state['points']} | **Bonus Points:** {state['bonus_points']} | "
-        f"**Total:** {state['points'] + state['bonus_points']}"
+    # Action line + quip + scoreboard, board image, checklist (single send)
+    await send_board_state(
+        ctx, state, board_letter,
+        f"📊 **Progress update** for {format_team_text(team_key)} on **Board {board_letter}**",
+        quip,
     )
 
-    # 4) board image
-    img_bytes = create_board_image_with_checks(board_letter, state["completed_tiles"])
-    await ctx.send(file=discord.File(img_bytes, filename="board.png"))
-
-    # 5) checklist
-    descriptions = get_tile_descriptions(board_letter, state["completed_tiles"])
-    await ctx.send(f"📋 __Board {board_letter} – Checklist__\n\n{descriptions}")
-
 
 
 
@@ -1868,8 +1884,7 @@ async def progress(ctx):
 # ------- Show team points (single send) -------
 @bot.command()
 async def points(ctx):
-    team_name = ctx.channel.name.replace("-", "")
-    team_key = normalize_team_name(team_name)
+    team_key = channel_team_key(ctx.channel)
 
     if team_key not in game_state:
         await ctx.send("Invalid team name.")
@@ -1897,33 +1912,65 @@ async def points(ctx):
         f"• **Total Points:** {total}"
     )
 
+# Fixed header + rule for the pointsallteams table
+_POINTS_TABLE_HEADER = f"{'Team':<8}{'Tiles':>7}{'Bonus':>7}{'Total':>8}"
+_POINTS_TABLE_HEADER += "\n" + "-" * len(_POINTS_TABLE_HEADER)
+
 # ------- Admin: overview points for all teams -------
 @bot.command(hidden=True)
 @is_allowed_admin()
 async def pointsallteams(ctx):
     """Admin-only: show points, bonus, and totals for every team (sorted by total desc)."""
     rows = []
-    for team_key in team_sequences.keys():
+    for team_key in team_sequences:
         state = game_state.get(team_key, {})
-        team_name = f"Team {team_key[-1]}"
-        tiles = int(state.get("points", 0))
-        bonus = int(state.get("bonus_points", 0))
-        total = tiles + bonus
-        rows.append((team_name, tiles, bonus, total))
-
+        rows.append((format_team_text(team_key), int(state.get("points", 0)), int(state.get("bonus_points", 0))))
     # Sort by total (desc), then by team name for stable ordering
-    rows.sort(key=lambda r: (-r[3], r[0]))
+    rows.sort(key=lambda r: (-(r[1] + r[2]), r[0]))
+    table = "\n".join([
+        _POINTS_TABLE_HEADER,
+        *(f"{name:<8}{tiles:>7}{bonus:>7}{tiles + bonus:>8}" for name, tiles, bonus in rows),
+    ])
+    await ctx.send(f"🏁 **All Teams — Points Overview** 🏁\n```{table}```")
 
-    # Build a neat table
-    header = f"{'Team':<8}{'Tiles':>7}{'Bonus':>7}{'Total':>8}"
-    line   = "-" * len(header)
-    lines = [header, line]
-    for team_name, tiles, bonus, total in rows:
-        lines.append(f"{team_name:<8}{tiles:>7}{bonus:>7}{total:>8}")
 
-    table = "\n".join(lines)
-    await ctx.send(f"🏁 **All Teams — Points Overview** 🏁\n```{table}```")
 
+# Discord's bulk-delete endpoint takes 2–100 messages, none older than 14 days
+BULK_DELETE_MAX = 100
+BULK_DELETE_MAX_AGE = timedelta(days=14)
+
+
+async def _delete_messages(channel, messages) -> int:
+    """Delete `messages`, 100 per bulk call where allowed; returns how many went.
+    Messages too old for bulk delete (or a lone leftover) are deleted one by one.
+    Without Manage Messages the bulk call is refused, so we fall back to that too."""
+    cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE + timedelta(minutes=1)
+    young = [m for m in messages if m.created_at > cutoff]
+    singles = [m for m in messages if m.created_at <= cutoff]
+    deleted = 0
+
+    for i in range(0, len(young), BULK_DELETE_MAX):
+        batch = young[i:i + BULK_DELETE_MAX]
+        if len(batch) < 2:
+            singles.extend(batch)
+            continue
+        try:
+            await channel.delete_messages(batch)
+            deleted += len(batch)
+        except discord.HTTPException:  # incl. Forbidden: retry those one by one
+            singles.extend(batch)
+
+    for msg in singles:
+        try:
+            await msg.delete()
+            deleted += 1
+        except discord.NotFound:
+            pass
+        except discord.Forbidden:
+            raise
+        except discord.HTTPException:
+            pass
+    return deleted
 
 
 @bot.command()
@@ -1931,24 +1978,39 @@ async def pointsallteams(ctx):
 async def cleanup(ctx, limit: int = 5000):
     """Delete all messages sent by the bot in this channel."""
     channel = ctx.channel
-    deleted = 0
 
-    async for message in channel.history(limit=limit):
-        if message.author == bot.user:  # only delete messages from the bot
-            try:
-                await message.delete()
-                deleted += 1
-            except discord.Forbidden:
-                await ctx.send("⚠️ I don’t have permission to delete messages here.")
-                return
-            except discord.HTTPException:
-                continue
+    # purge() bulk-deletes in 100s and falls back to single deletes for >14-day-old messages.
+    # Bulk delete needs Manage Messages for the bot itself; our own messages don't
+    bulk = channel.permissions_for(ctx.guild.me).manage_messages
+    try:
+        deleted = len(await channel.purge(limit=limit, check=lambda m: m.author == bot.user, bulk=bulk))
+    except discord.Forbidden:
+        await ctx.send("⚠️ I don’t have permission to delete messages here.")
+        return
 
     await ctx.send(f"🧹 Cleaned up {deleted} of my messages in {channel.mention}.", delete_after=5)
 
 
 
 
+# Message link (…/channels/<guild>/<channel>/<message>) or a bare trailing ID
+_CHANNEL_LINK_RE = re.compile(r"/channels/\d+/\d+/(\d{15,25})")
+_TRAILING_ID_RE = re.compile(r"(\d{15,25})$")
+
+
+def _extract_message_id(s: str) -> int | None:
+    if not s:
+        return None
+    s = s.strip().strip("<>").strip()
+    m = _CHANNEL_LINK_RE.search(s)
+    if m:
+        return int(m.group(1))
+    m = _TRAILING_ID_RE.search(s)
+    if m:
+        return int(m.group(1))
+    return int(s) if s.isdigit() else None
+
+
 @bot.command()
 @is_allowed_admin()
 async def delete(ctx, target: str = "", force: str = ""):
@@ -1960,25 +2022,9 @@ async def delete(ctx, target: str = "", force: str = ""):
       (reply to a message) !delete
       Add 'force' to delete non-bot messages (requires Manage Messages).
     """
-    import re
-
-    # --- Always try to delete the trigger immediately ---
-    try:
+    # --- Always try to delete the trigger immediately (ignore no perms / already deleted) ---
+    with suppress(discord.HTTPException):
         await ctx.message.delete()
-    except Exception:
-        pass  # Ignore if no perms or already deleted
-
-    def _extract_message_id(s: str) -> int | None:
-        if not s:
-            return None
-        s = s.strip().strip("<>").strip()
-        m = re.search(r"/channels/\d+/\d+/(\d{15,25})", s)
-        if m:
-            return int(m.group(1))
-        m = re.search(r"(\d{15,25})$", s)
-        if m:
-            return int(m.group(1))
-        return int(s) if s.isdigit() else None
 
     # Allow replying to a message with !delete and no args
     message_id = _extract_message_id(target) if target else None
@@ -2025,16 +2071,12 @@ async def purge(ctx, *args):
     """
     Admin-only purge:
       !purge N              -> delete the last N bot-authored messages in this channel
-      !purge all            -> arm a 20s confirmation window to purge EVERYTHING
-      !purge all confirm    -> within 20s, deletes ALL messages (bot + players)
+      !purge all            -> arm a confirmation window (PURGE_CONFIRM_SECONDS) to purge EVERYTHING
+      !purge all confirm    -> within that window, deletes ALL messages (bot + players)
     """
-    import time
-
     # Always delete the trigger immediately
-    try:
+    with suppress(discord.HTTPException):
         await ctx.message.delete()
-    except Exception:
-        pass
 
     if len(args) == 0:
         await ctx.send("❓ Usage: `!purge N` (bot-only) or `!purge all` (everything with confirm).", delete_after=7)
@@ -2042,22 +2084,20 @@ async def purge(ctx, *args):
 
     # --- Mode: "all" (two-step confirm) ---
     if args[0].lower() == "all":
-        now = time.time()
         chan_key = ctx.channel.id
         pending = PENDING_PURGE_CONFIRMATIONS.get(chan_key)
 
-        # If user typed "confirm"
+        # If user typed "confirm" (expired entries were already dropped by their timer)
         if len(args) >= 2 and args[1].lower() == "confirm":
-            if pending and pending["user"] == ctx.author.id and now <= pending["expires"]:
+            if pending and pending.user == ctx.author.id:
+                pending.handle.cancel()
                 PENDING_PURGE_CONFIRMATIONS.pop(chan_key, None)
                 try:
                     deleted = await ctx.channel.purge(limit=None)  # everything
                     confirm = await ctx.send(f"🧨 Purged {len(deleted)} messages from this channel (everything).")
                     await asyncio.sleep(5)
-                    try:
+                    with suppress(discord.HTTPException):
                         await confirm.delete()
-                    except Exception:
-                        pass
                 except discord.Forbidden:
                     await ctx.send("⚠️ I need **Manage Messages** + **Read Message History** to purge everything.", delete_after=7)
                 except discord.HTTPException:
@@ -2066,16 +2106,18 @@ async def purge(ctx, *args):
                 await ctx.send("⏳ No active purge for this channel or it expired. Run `!purge all` again to arm it.", delete_after=7)
             return
 
-        # First step: arm confirmation window
-        PENDING_PURGE_CONFIRMATIONS[chan_key] = {
-            "user": ctx.author.id,
-            "expires": now + 20  # 20 seconds
-        }
+        # First step: arm confirmation window; the timer drops it if nobody confirms
+        if pending:
+            pending.handle.cancel()
+        handle = asyncio.get_running_loop().call_later(
+            PURGE_CONFIRM_SECONDS, PENDING_PURGE_CONFIRMATIONS.pop, chan_key, None
+        )
+        PENDING_PURGE_CONFIRMATIONS[chan_key] = PurgeReq(ctx.author.id, handle)
         warn = (
             "⚠️ **Danger zone:** This will delete **ALL messages** in this channel (bot + players).\n"
-            "Type `!purge all confirm` within **20 seconds** to proceed. Otherwise, it auto-cancels."
+            f"Type `!purge all confirm` within **{PURGE_CONFIRM_SECONDS} seconds** to proceed. Otherwise, it auto-cancels."
         )
-        await ctx.send(warn, delete_after=20)
+        await ctx.send(warn, delete_after=PURGE_CONFIRM_SECONDS)
         return
 
     # --- Mode: N bot messages only ---
@@ -2086,130 +2128,115 @@ async def purge(ctx, *args):
         return
 
     n = max(1, min(n, 1000))  # sane cap
-    deleted = 0
     try:
-        async for msg in ctx.channel.history(limit=None):
+        targets = []
+        # Bounded scan: busy channels can't turn this into dozens of history pages
+        async for msg in ctx.channel.history(limit=max(PURGE_SCAN_MIN, n * PURGE_SCAN_FACTOR)):
             if msg.author == bot.user:
-                try:
-                    await msg.delete()
-                    deleted += 1
-                except discord.NotFound:
-                    pass
-                except discord.Forbidden:
-                    await ctx.send("⚠️ Missing permission to delete some bot messages.", delete_after=7)
-                    return
-                except discord.HTTPException:
-                    pass
-                if deleted >= n:
+                targets.append(msg)
+                if len(targets) >= n:
                     break
+        try:
+            deleted = await _delete_messages(ctx.channel, targets)
+        except discord.Forbidden:
+            await ctx.send("⚠️ Missing permission to delete some bot messages.", delete_after=7)
+            return
         note = await ctx.send(f"🧹 Purged {deleted} bot message{'s' if deleted != 1 else ''} from this channel.")
         await asyncio.sleep(3)
-        try:
+        with suppress(discord.HTTPException):
             await note.delete()
-        except Exception:
-            pass
     except discord.Forbidden:
         await ctx.send("⚠️ I need **Read Message History** to purge.", delete_after=7)
     except discord.HTTPException:
         await ctx.send("⚠️ Purge failed due to an API error.", delete_after=7)
 
 
+# Static help / intro bodies; only the quip line varies per send
+_BINGO_COMMANDS_BODY = (
+    "**📜 Bingo Roulette Commands**\n"
+    "- `!startboard` — start your team’s first board. only use once!\n"
+    "- `!tile1` … `!tile9` — use after you finish a tile to mark it as complete\n"
+    "- `!finishbonus` — use after you complete the bonus tile to advance\n"
+    "- `!skipbonus` — skip the bonus tile and advance\n"
+    "- `!progress` — show your board image, checklist, and points\n"
+    "- `!points` — show your team’s point totals\n"
+    "- `!bingocommands` — to display this command list\n"
+)
+
 @bot.command(name="bingocommands")
 async def show_bingo_commands(ctx):
-    quip = get_quip("global", "help_commands", [
-        "Fine, mortals. Here are your precious commands. Try not to pull a muscle scrolling. 🙃",
-        "Command scroll unfurled! Don’t smudge it with your grubby fingers.",
-        "A list of commands? Riveting. Use them wisely—or spectacularly badly. I’ll mock you either way.",
-    ])
-
-    msg = (
-        f"{quip}\n\n"
-        "**📜 Bingo Roulette Commands**\n"
-        "- `!startboard` — start your team’s first board. only use once!\n"
-        "- `!tile1` … `!tile9` — use after you finish a tile to mark it as complete\n"
-        "- `!finishbonus` — use after you complete the bonus tile to advance\n"
-        "- `!skipbonus` — skip the bonus tile and advance\n"
-        "- `!progress` — show your board image, checklist, and points\n"
-        "- `!points` — show your team’s point totals\n"
-        "- `!bingocommands` — to display this command list\n"
-    )
-    await ctx.send(msg)
-
+    quip = get_quip("global", "help_commands", QUIPS_HELP_COMMANDS)
+    await ctx.send(f"{quip}\n\n{_BINGO_COMMANDS_BODY}")
+
+
+_ALL_COMMANDS_BODY = (
+    "**📜 Full Command Index**\n\n"
+
+    "**• Team Commands (run only in respective team’s channel)**\n"
+    "- `!startboard` — start your team’s first board\n"
+    "- `!tile1` … `!tile9` — mark a tile as complete\n"
+    "- `!finishbonus` — complete the bonus tile and advance\n"
+    "- `!skipbonus` — skip the bonus tile and advance\n"
+    "- `!progress` — show your board image, checklist, and points\n"
+    "- `!points` — show your team’s point totals\n"
+    "- `!bingocommands` — show participant's command list\n\n"
+
+    "**• Admin Commands**\n"
+    "- `!addpoints X team#` — add tile points\n"
+    "- `!removepoints X team#` — remove tile points\n"
+    "- `!addbonuspoints X team#` — add bonus points\n"
+    "- `!removebonuspoints X team#` — remove bonus points\n"
+    "- `!removetile1` … `!removetile9` — undo a tile\n"
+    "- `!tileall team#` — mark all 9 tiles complete (testing only)\n"
+    "- `!allcommands` — show this full command list\n"
+)
 
 @bot.command(name="allcommands", hidden=True)
 @is_allowed_admin()
 async def show_all_commands(ctx):
-    quip = get_quip("global", "help_allcommands", [
-        "Ah, the secret scroll. Handle it with care—or don’t, and I’ll laugh. 🙃",
-        "So you want the whole playbook? Fine. Try not to drown in power.",
-        "Admin knowledge unlocked. Abuse it spectacularly, please.",
-    ])
+    quip = get_quip("global", "help_allcommands", QUIPS_HELP_ALLCOMMANDS)
+    await ctx.send(f"{quip}\n\n{_ALL_COMMANDS_BODY}")
+
+
+_INTRO_MSG = (
+    "**🔥 Welcome to Bingo Roulette!**\n"
+    "- Please read through the full rules and info here: https://discord.com/channels/649974578424184833/1422522047489376368/1426381912880189440\n"
+    "- This event features 6 rotating bingo boards in a predetermined random order.\n"
+    "- Teams will work on one board at a time. After you complete every tile on one board, you will proceed to the next board.\n"
+    "- Once you complete the final sixth board, the sequence of boards will begin again.\n\n"
+
+    "**🎲 Simplified Gameplay Loop**\n"
+    "- Event start: `!startboard` — Use this command to activate Bingo Roulette and show your team’s first board!\n"
+    "- #1 Use `!tile#` to check-off tiles after completing them (e.g. `!tile3`).\n"
+    "- #2 Use `!finishbonus` after completing the Bonus Tile or use `!skipbonus` to skip the Bonus Tile.\n"
+    "- rinse n' repeat steps 1 and 2.\n\n" 
+    
 
-    msg = (
-        f"{quip}\n\n"
-        "**📜 Full Command Index**\n\n"
-
-        "**• Team Commands (run only in respective team’s channel)**\n"
-        "- `!startboard` — start your team’s first board\n"
-        "- `!tile1` … `!tile9` — mark a tile as complete\n"
-        "- `!finishbonus` — complete the bonus tile and advance\n"
-        "- `!skipbonus` — skip the bonus tile and advance\n"
-        "- `!progress` — show your board image, checklist, and points\n"
-        "- `!points` — show your team’s point totals\n"
-        "- `!bingocommands` — show participant's command list\n\n"
-
-        "**• Admin Commands**\n"
-        "- `!addpoints X team#` — add tile points\n"
-        "- `!removepoints X team#` — remove tile points\n"
-        "- `!addbonuspoints X team#` — add bonus points\n"
-        "- `!removebonuspoints X team#` — remove bonus points\n"
-        "- `!removetile1` … `!removetile9` — undo a tile\n"
-        "- `!tileall team#` — mark all 9 tiles complete (testing only)\n"
-        "- `!allcommands` — show this full command list\n"
-    )
+    "**📜 Points**\n"
+    "- You earn 1 point per completed tile\n"
+    "- Bonus Tiles and Team Challenges will earn you additional bonus points\n"
+    "- The team with the most points at the end wins!\n\n"
+
+    "**🏠 House Rules**\n"
+    "- Keep all chatter in the chit-chat channel. This channel is for bot commands only. Please don't abuse Betty.\n"
+    "- All drops should be posted in the drops channel. Please refer to the rules-and-info channel for screenshot requirements: https://discord.com/channels/649974578424184833/1422522047489376368/1426388172757274674\n"
+    "- Use `!progress`, `!points`, and `!bingocommands` to see your current board, your current points, and a list of available commands\n"
+    "- Please be respectful, kind, and courteous to your teammates and refs. Keep it positive, have fun, and for the love of Betty, take a damn shower!\n\n"
 
-    await ctx.send(msg)
+    "**🔮 Ready?**\n"
+    "- Type `!startboard` when you’re ready to start Bingo Roulette. Godspeed."
+)
 
 @bot.command()
 async def intro(ctx):
     """Show the rules and how to start the game (team channels only)."""
-    team_name = ctx.channel.name.replace("-", "")
-    team_key = normalize_team_name(team_name)
+    team_key = channel_team_key(ctx.channel)
 
     if team_key not in game_state:
         await ctx.send("This command can only be used in a team channel.")
         return
 
-    msg = (
-        "**🔥 Welcome to Bingo Roulette!**\n"
-        "- Please read through the full rules and info here: https://discord.com/channels/649974578424184833/1422522047489376368/1426381912880189440\n"
-        "- This event features 6 rotating bingo boards in a predetermined random order.\n"
-        "- Teams will work on one board at a time. After you complete every tile on one board, you will proceed to the next board.\n"
-        "- Once you complete the final sixth board, the sequence of boards will begin again.\n\n"
-
-        "**🎲 Simplified Gameplay Loop**\n"
-        "- Event start: `!startboard` — Use this command to activate Bingo Roulette and show your team’s first board!\n"
-        "- #1 Use `!tile#` to check-off tiles after completing them (e.g. `!tile3`).\n"
-        "- #2 Use `!finishbonus` after completing the Bonus Tile or use `!skipbonus` to skip the Bonus Tile.\n"
-        "- rinse n' repeat steps 1 and 2.\n\n" 
-        
-
-        "**📜 Points**\n"
-        "- You earn 1 point per completed tile\n"
-        "- Bonus Tiles and Team Challenges will earn you additional bonus points\n"
-        "- The team with the most points at the end wins!\n\n"
-
-        "**🏠 House Rules**\n"
-        "- Keep all chatter in the chit-chat channel. This channel is for bot commands only. Please don't abuse Betty.\n"
-        "- All drops should be posted in the drops channel. Please refer to the rules-and-info channel for screenshot requirements: https://discord.com/channels/649974578424184833/1422522047489376368/1426388172757274674\n"
-        "- Use `!progress`, `!points`, and `!bingocommands` to see your current board, your current points, and a list of available commands\n"
-        "- Please be respectful, kind, and courteous to your teammates and refs. Keep it positive, have fun, and for the love of Betty, take a damn shower!\n\n"
-
-        "**🔮 Ready?**\n"
-        "- Type `!startboard` when you’re ready to start Bingo Roulette. Godspeed."
-    )
-
-    await ctx.send(msg)
+    await ctx.send(_INTRO_MSG)
 
 # === Team Challenge Announcements (final formatted version) ==================
 
@@ -2303,21 +2330,51 @@ CHALLENGE_INFO = {
 }
 
 
-def _build_challenge_embed(num: int) -> tuple[discord.Embed, discord.File]:
+def _make_challenge_embed(num: int) -> discord.Embed:
     info = CHALLENGE_INFO[num]
-    img_path = CHALLENGE_DIR / info["image"]
-    if not img_path.exists():
-        raise FileNotFoundError(f"Image not found: {img_path} — place it in assets/challenges/")
-
     embed = discord.Embed(
         title=f"💎 Team Challenge #{num} — {info['title']}",
         description=info["description"],
         color=discord.Color.gold(),
     )
-    file = discord.File(str(img_path), filename=img_path.name)
-    embed.set_image(url=f"attachment://{img_path.name}")
+    embed.set_image(url=f"attachment://{info['image']}")
     embed.set_footer(text="Bingo Roulette")
-    return embed, file
+    return embed
+
+
+def _read_challenge_image(num: int) -> bytes | None:
+    img_path = CHALLENGE_DIR / CHALLENGE_INFO[num]["image"]
+    try:
+        return img_path.read_bytes()
+    except FileNotFoundError:
+        log.warning("[challenge] Image not found: %s — place it in assets/challenges/", img_path)
+        return None
+
+
+# Static content: build every embed once, not per post. Images are read once
+# at startup (load_challenge_images, from on_ready), never on a command.
+CHALLENGE_EMBEDS = {num: _make_challenge_embed(num) for num in CHALLENGE_INFO}
+CHALLENGE_IMAGES: dict[int, bytes | None] = {}
+
+
+async def load_challenge_images():
+    """Read all challenge PNGs concurrently off the loop; disable commands whose image is missing."""
+    nums = list(CHALLENGE_INFO)
+    images = await asyncio.gather(*(asyncio.to_thread(_read_challenge_image, n) for n in nums))
+    CHALLENGE_IMAGES.update(zip(nums, images))
+    for num, data in CHALLENGE_IMAGES.items():
+        if data is None and (cmd := bot.get_command(f"teamchallenge{num}")):
+            cmd.enabled = False
+
+
+def _build_challenge_embed(num: int) -> tuple[discord.Embed, discord.File]:
+    data = CHALLENGE_IMAGES.get(num)
+    if data is None:
+        raise FileNotFoundError(
+            f"Image not found: {CHALLENGE_DIR / CHALLENGE_INFO[num]['image']} — place it in assets/challenges/"
+        )
+    # discord.File consumes its stream, so each post gets a fresh one over the cached bytes
+    return CHALLENGE_EMBEDS[num], discord.File(BytesIO(data), filename=CHALLENGE_INFO[num]["image"])
 
 
 def make_teamchallenge_command(num: int):
@@ -2330,16 +2387,14 @@ def make_teamchallenge_command(num: int):
             return
 
         # Delete the trigger if possible
-        try:
+        with suppress(discord.HTTPException):
             await ctx.message.delete()
-        except discord.HTTPException:
-            pass
 
         # Post the embed
         await ctx.send(file=file, embed=embed)
 
         # --- spectator ping only when posted in roulette-announcements (not admin-bot) ---
-        if _is_announce_channel(ctx.channel):
+        if ENABLE_SPECTATOR_ANNOUNCE and _is_announce_channel(ctx.channel):
             try:
                 raw_title = CHALLENGE_INFO[num]["title"]
                 name = raw_title.split("\n", 1)[0].strip()
@@ -2362,58 +2417,85 @@ for _n in range(1, 6):
 
 
 
+_FINISH_TEMPLATE = (
+    "🏆 {team} has **completed Bingo Roulette!** 🎉\n\n"
+    "{scoreboard}\n\n"
+    "✨ Well done, gamers."
+).format
+
+
 # ------- Admin: finalize a team's event -------
 @bot.command(hidden=True)
 @is_allowed_admin()
 async def finishevent(ctx, *, team: str):
     """Admin-only: mark a team as finished and announce their final score."""
     team_key = normalize_team_name(team)
-    if team_key not in game_state:
+    if team_key not in TEAM_KEYS:
         await ctx.send("Invalid team name.")
         return
 
     state = game_state[team_key]
     state["finished"] = True  # 👈 freeze the team
-    await save_state(game_state)
+    mark_state_dirty()
 
+    await ctx.send(_FINISH_TEMPLATE(team=format_team_text(team_key), scoreboard=_format_scoreboard(state)))
 
-    total = state['points'] + state['bonus_points']
+# Admin trigger messages queued for deletion, per channel; flushed in bulk so a
+# burst of admin commands costs one bulk-delete call instead of one DELETE each
+TRIGGER_DELETE_INTERVAL = 0.75
+_pending_deletes: dict[int, list[discord.Message]] = defaultdict(list)
+_deletes_pending = asyncio.Event()
+
+
+async def _trigger_delete_flusher():
+    while True:
+        await _deletes_pending.wait()
+        await asyncio.sleep(TRIGGER_DELETE_INTERVAL)
+        _deletes_pending.clear()
+        batches = list(_pending_deletes.values())
+        _pending_deletes.clear()
+        for msgs in batches:
+            try:
+                await _delete_messages(msgs[0].channel, msgs)
+            except (discord.Forbidden, discord.NotFound):
+                # No perms or already deleted — ignore silently
+                pass
+            except Exception:
+                # Network blips etc. must not kill the flusher for the rest of the run
+                log.exception("[TRIGGER] Deleting admin triggers failed")
 
-    await ctx.send(
-        f"🏆 {format_team_text(team_key)} has **completed Bingo Roulette!** 🎉\n\n"
-        f"🧮 **Points:** {state['points']} | **Bonus Points:** {state['bonus_points']} | "
-        f"**Total:** {total}\n\n"
-        f"✨ Well done, gamers."
-    )
 
 @bot.before_invoke
 async def _auto_delete_admin_triggers(ctx):
-    try:
-        if ctx.command and ctx.command.name in ADMIN_COMMAND_NAMES:
-            await ctx.message.delete()
-    except Exception:
-        # No perms or already deleted — ignore silently
-        pass
+    # Runs before every command: non-admin commands leave on one set lookup
+    if getattr(ctx.command, "name", None) not in ADMIN_COMMAND_NAMES:
+        return
+    # Deleting someone else's message needs Manage Messages; without it the call
+    # would just 403, so don't queue it (also covers DMs, where it can't work)
+    if ctx.guild is None or not ctx.channel.permissions_for(ctx.guild.me).manage_messages:
+        return
+    _pending_deletes[ctx.channel.id].append(ctx.message)
+    _deletes_pending.set()
 
 @bot.command(name="ping")
 async def ping(ctx):
     """Quick sanity check: logs where it was called from and replies 'pong'."""
     try:
-        guild_name = getattr(ctx.guild, "name", "(DMs)")
-        channel_name = getattr(ctx.channel, "name", f"(type={type(ctx.channel).__name__})")
-        author = f"{ctx.author} ({ctx.author.id})"
-
-        # Log to stdout (shows in your host logs)
-        print("[PING]",
-              f"guild={guild_name}",
-              f"channel={channel_name}",
-              f"author={author}",
-              f"latency={bot.latency:.3f}s")
+        # latency is inf until the first heartbeat ACK after a (re)connect
+        lat = f"{round(bot.latency * 1000)} ms" if math.isfinite(bot.latency) else "n/a"
+
+        # Log where it came from (lazy %-args: nothing is formatted if INFO is off)
+        log.info(
+            "[PING] guild=%s channel=%s author=%s (%s) latency=%s",
+            getattr(ctx.guild, "name", "(DMs)"),
+            getattr(ctx.channel, "name", None) or f"(type={type(ctx.channel).__name__})",
+            ctx.author, ctx.author.id, lat,
+        )
 
         # Confirm in channel
-        await ctx.send(f"pong ({bot.latency:.3f}s)")
-    except Exception as e:
-        print("[PING][ERROR]", repr(e))
+        await ctx.send(f"pong ({lat})")
+    except discord.HTTPException as e:
+        log.exception("[PING][ERROR] %r", e)
         await ctx.send(f"pong? something went wrong: `{type(e).__name__}: {e}`")
 
 @bot.command()
@@ -2426,24 +2508,39 @@ async def hola(ctx):
 @is_allowed_admin()
 async def spectatortest(ctx):
     """Quick test to see if spectator messages work."""
-    await spectator_tile_completed(ctx.guild, "team1")
-    await ctx.send("✅ Tried sending to spectator channel.")
+    # Independent channels: post the test and the confirmation together
+    await asyncio.gather(
+        spectator_tile_completed(ctx.guild, "team1"),
+        ctx.send("✅ Tried sending to spectator channel."),
+    )
+
+
+def _has_any_png(directory) -> bool:
+    """True as soon as one *.png file turns up (no full listing, no Path objects)."""
+    with os.scandir(directory) as it:
+        return any(e.name.endswith(".png") and e.is_file() for e in it)
 
 
 @bot.command(hidden=True)
 @is_allowed_admin()
 async def diag(ctx):
     issues = []
+    # Independent checks run together: asset scan (disk, on a thread) + spectator resolve
+    has_png, ch = await asyncio.gather(
+        asyncio.to_thread(_has_any_png, ASSETS_DIR),
+        _get_spectator_channel(ctx.guild),
+        return_exceptions=True,
+    )
+
     # assets
-    try:
-        pngs = [p.name for p in ASSETS_DIR.glob("*.png")]
-        if not pngs: issues.append("No board PNGs found in assets/boards/")
-    except Exception as e:
-        issues.append(f"ASSETS_DIR error: {e}")
+    if isinstance(has_png, Exception):
+        issues.append(f"ASSETS_DIR error: {has_png}")
+    elif not has_png: issues.append("No board PNGs found in assets/boards/")
 
     # spectator perms
-    ch = await _get_spectator_channel(ctx.guild)
-    if not ch: issues.append("Spectator channel unresolved (ID/name mismatch?)")
+    if isinstance(ch, Exception):
+        issues.append(f"Spectator channel lookup failed: {ch}")
+    elif not ch: issues.append("Spectator channel unresolved (ID/name mismatch?)")
     else:
         perms = ch.permissions_for(ctx.guild.me)
         if not perms.send_messages: issues.append(f"No send permission in {ch.mention}")
@@ -2460,4 +2557,10 @@ async def diag(ctx):
 
 # --- Run the bot ---
 if __name__ == "__main__":
-    bot.run(DISCORD_TOKEN)
+    try:
+        bot.run(DISCORD_TOKEN)
+    finally:
+        # Flush anything the debounced writer hadn't persisted yet
+        if getattr(bot, "_initialized", False):
+            _write_state_file(_serialize_state())
+        _log_listener.stop()  # drain queued log records before exit